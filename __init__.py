@@ -13,10 +13,9 @@ bl_info = {
 import bpy
 from bpy.types import Context, OperatorFileListElement, Menu, UILayout
 from bpy_extras.io_utils import ExportHelper, ImportHelper
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from .roommesh_import import import_roommesh
-from .roommesh_export import export_roommesh
-from . import roommesh_properties
+import traceback
 
 # Define classes
 class IMPORT_OT_RoomMesh(bpy.types.Operator,
@@ -48,35 +47,57 @@ class IMPORT_OT_RoomMesh(bpy.types.Operator,
             set[str]: Debug message.
         """
         
-        # Attempt to import selected files
-        try:
-            # Check if multiple files selected
-            if self.files:
-                # Loop through RoomMesh files
-                for rmesh in self.files:
-                    # Get file path
-                    filepath: Path = Path(self.directory) / rmesh.name
-                    
-                    # Import file
-                    import_roommesh(filepath)
-            else:
-                # Get file path
-                filepath: Path = Path(self.filepath)
-                
-                # Import file
-                import_roommesh(filepath)
-            
-            # Debug info
-            self.report({"INFO"}, "RoomMesh import finished.")
-            
-            # Return successfully
-            return {"FINISHED"}
-        except Exception as e:
-            # Print error
-            self.report({"ERROR"}, f"RoomMesh import failed: {e}")
-            
-            # Return unsuccessfully
+        # Load importer only when it is needed
+        from .roommesh_import import import_roommesh, parse_roommesh
+
+        # Get file paths
+        if self.files:
+            directory: Path = Path(self.directory)
+            filepaths: list[Path] = [directory / rmesh.name for rmesh in self.files]
+        else:
+            filepaths: list[Path] = [Path(self.filepath)]
+
+        # Parse files on worker threads
+        with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as executor:
+            parses: list[Future] = [executor.submit(parse_roommesh, filepath) for filepath in filepaths]
+
+        # Save failure count
+        failures: int = 0
+
+        # Loop through parsed RoomMesh files
+        for filepath, parse in zip(filepaths, parses):
+            # Attempt to import file, skipping it on failure
+            try:
+                room = import_roommesh(filepath, parse.result())
+            except Exception as e:
+                # Print error
+                traceback.print_exc()
+                self.report({"ERROR"}, f"RoomMesh import failed for {filepath.name}: {e}")
+
+                # Increment failure count
+                failures += 1
+
+                # Continue loop
+                continue
+
+            # Count files that couldn't be found as failures, import_roommesh already reported them
+            if room is None:
+                # Increment failure count
+                failures += 1
+
+        # Return unsuccessfully if nothing was imported
+        if failures == len(filepaths):
             return {"CANCELLED"}
+
+        # Debug info
+        if failures:
+            self.report({"WARNING"}, f"RoomMesh import partially finished: "
+                                     f"{len(filepaths) - failures} of {len(filepaths)} files imported.")
+        else:
+            self.report({"INFO"}, "RoomMesh import finished.")
+
+        # Return successfully
+        return {"FINISHED"}
         
     def draw(self, context: Context) -> None:
         """
@@ -123,10 +144,17 @@ class EXPORT_OT_RoomMesh(bpy.types.Operator,
             set[str]: Debug message.
         """
 
+        # Load exporter only when it is needed
+        from .roommesh_export import export_roommesh
+
         # Attempt to export selected files
         try:
             # Get file path
-            filepath: Path = Path(self.filepath).with_suffix(self.filename_ext)
+            filepath: Path = Path(self.filepath)
+
+            # Ensure file extension is correct
+            if filepath.suffix.lower() != self.filename_ext:
+                filepath = filepath.with_suffix(self.filename_ext)
 
             # Export file
             export_roommesh(context, filepath)
@@ -202,17 +230,35 @@ def register() -> None:
     Returns:
         None.
     """
+
+    # Load property definitions
+    from . import roommesh_properties
     
+    # Get registration functions
+    register_class = bpy.utils.register_class
+    unregister_class = bpy.utils.unregister_class
+
     # Loop through classes
     for cls in classes:
-        # Register class
-        bpy.utils.register_class(cls)
+        # Attempt to register class
+        try:
+            register_class(cls)
+        except ValueError:
+            # Replace class left registered by a previous reload
+            unregister_class(cls)
+            register_class(cls)
     
-    # Add import option
-    bpy.types.TOPBAR_MT_file_import.append(menu_function_import)
+    # Loop through menu options
+    for menu, menu_function in ((bpy.types.TOPBAR_MT_file_import, menu_function_import),
+                                (bpy.types.TOPBAR_MT_file_export, menu_function_export)):
+        # Remove option left by a previous register call
+        try:
+            menu.remove(menu_function)
+        except ValueError:
+            pass
 
-    # Add export option
-    bpy.types.TOPBAR_MT_file_export.append(menu_function_export)
+        # Add import/export option
+        menu.append(menu_function)
 
     # Add custom properties
     roommesh_properties.register()
@@ -226,6 +272,9 @@ def unregister() -> None:
         None.
     """
 
+    # Load property definitions
+    from . import roommesh_properties
+
     # Remove custom properties
     roommesh_properties.unregister()
 
@@ -235,10 +284,13 @@ def unregister() -> None:
     # Remove import option
     bpy.types.TOPBAR_MT_file_import.remove(menu_function_import)
     
+    # Get unregistration function
+    unregister_class = bpy.utils.unregister_class
+
     # Loop through classes reversed
     for cls in reversed(classes):
         # Unregister class
-        bpy.utils.unregister_class(cls)
+        unregister_class(cls)
 
 # Ensure direct execution
 if __name__ == "__main__":
@@ -13,10 +13,161 @@ RoomMesh that can be used within SCP: Containment Breach.
 """
 
 # Import modules
-from abc import abstractmethod
+from array import array
+from collections.abc import MutableSequence
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
+import mmap
 import struct
 import sys
-from typing import BinaryIO, TextIO
+from typing import BinaryIO, Iterator, TextIO
+
+# Define binary record layouts. Offsets give the byte position of each x, y, z (or u, v / r, g, b) field within a
+# record, since RoomMesh stores positions in x, z, y order.
+_BYTE_STRUCT: struct.Struct = struct.Struct('<B')
+_INTEGER_STRUCT: struct.Struct = struct.Struct('<I')
+_FLOAT_STRUCT: struct.Struct = struct.Struct('<f')
+_VERTEX_STRUCT: struct.Struct = struct.Struct('<7f3B')
+_COORDINATE_STRUCT: struct.Struct = struct.Struct('<3f')
+_UV_STRUCT: struct.Struct = struct.Struct('<2f')
+_COLOR_STRUCT: struct.Struct = struct.Struct('<3B')
+_TRIANGLE_STRUCT: struct.Struct = struct.Struct('<3I')
+_VERTEX_POSITION_OFFSETS: tuple[int, ...] = (0, 8, 4)
+_VERTEX_UV_1_OFFSETS: tuple[int, ...] = (12, 16)
+_VERTEX_UV_2_OFFSETS: tuple[int, ...] = (20, 24)
+_VERTEX_COLOR_OFFSETS: tuple[int, ...] = (28, 29, 30)
+_COORDINATE_OFFSETS: tuple[int, ...] = (0, 8, 4)
+
+# Define parsing cursor
+class _Cursor:
+    """
+    Reads from an in-memory copy of a RoomMesh file. Provides the read() method used by the parse functions, so it
+    can be passed anywhere a binary file is expected, while avoiding a file call for every field.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        Creates a _Cursor instance over the remaining contents of a file. Memory-mapped files are read in place,
+        while all other files are read in a single call.
+
+        Args:
+            file (BinaryIO): The file opened in binary read mode.
+
+        Returns:
+            None.
+        """
+
+        # Get file data
+        if isinstance(file, mmap.mmap):
+            self.data: memoryview = memoryview(file)
+            self.offset: int = file.tell()
+        else:
+            self.data: memoryview = memoryview(file.read())
+            self.offset: int = 0
+
+    def read(self, size: int) -> bytes:
+        """
+        Reads up to a number of bytes and advances the cursor. Fewer bytes are returned at the end of the data.
+
+        Args:
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes: The bytes read.
+        """
+
+        # Get bytes
+        offset: int = self.offset
+        block: bytes = bytes(self.data[offset:offset + size])
+
+        # Advance cursor
+        self.offset = offset + len(block)
+
+        # Return bytes
+        return block
+
+    def unpack(self, layout: struct.Struct, context: str = 'struct data') -> tuple:
+        """
+        Unpacks a struct directly from the data and advances the cursor.
+
+        Args:
+            layout (Struct): The layout of the data.
+            context (str): The type of data being read. Used for debugging.
+
+        Returns:
+            tuple: The unpacked values.
+        """
+
+        # Ensure data is available
+        offset: int = self.offset
+        if offset + layout.size > len(self.data):
+            raise EOFError(f"Unexpected end-of-file while reading {context}.")
+
+        # Advance cursor
+        self.offset = offset + layout.size
+
+        # Return values
+        return layout.unpack_from(self.data, offset)
+
+    def decode(self, size: int, context: str = 'string data') -> str:
+        """
+        Decodes an ASCII string directly from the data and advances the cursor.
+
+        Args:
+            size (int): The length of the string in bytes.
+            context (str): The type of data being read. Used for debugging.
+
+        Returns:
+            str: The decoded string.
+        """
+
+        # Ensure data is available
+        offset: int = self.offset
+        if offset + size > len(self.data):
+            raise EOFError(f"Unexpected end-of-file while reading {context}.")
+
+        # Advance cursor
+        self.offset = offset + size
+
+        # Return string
+        return str(self.data[offset:offset + size], 'ascii')
+
+    def __enter__(self) -> '_Cursor':
+        """
+        Enters the cursor's context.
+
+        Returns:
+            _Cursor: The cursor.
+        """
+
+        # Return cursor
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Exits the cursor's context, releasing the underlying data.
+
+        Args:
+            *args: The exception information, if any.
+
+        Returns:
+            None.
+        """
+
+        # Release data
+        self.release()
+
+    def release(self) -> None:
+        """
+        Releases the underlying data so memory-mapped files can be closed.
+
+        Returns:
+            None.
+        """
+
+        # Release data
+        self.data.release()
 
 # Define helper functions
 def read_byte(file: BinaryIO,
@@ -40,7 +191,7 @@ def read_byte(file: BinaryIO,
         raise EOFError(f"Unexpected end-of-file while reading {context}.")
 
     # Convert byte to integer
-    return struct.unpack('B', byte)[0]
+    return byte[0]
 
 def read_integer(file: BinaryIO,
               context: str = 'integer data') -> int:
@@ -56,14 +207,7 @@ def read_integer(file: BinaryIO,
     """
 
     # Read integer
-    integer_bytes: bytes = file.read(4)
-
-    # Ensure integer read properly
-    if len(integer_bytes) != 4:
-        raise EOFError(f"Unexpected end-of-file while reading {context}.")
-
-    # Convert bytes to integer
-    return struct.unpack('<I', integer_bytes)[0]
+    return read_struct(file, _INTEGER_STRUCT, context)[0]
 
 def read_float(file: BinaryIO,
               context: str = 'float data') -> float:
@@ -79,37 +223,206 @@ def read_float(file: BinaryIO,
     """
 
     # Read float
-    float_bytes: bytes = file.read(4)
+    return read_struct(file, _FLOAT_STRUCT, context)[0]
+
+def read_block(file: BinaryIO,
+               size: int,
+               context: str = 'block data') -> bytes:
+    """
+    Reads a fixed number of bytes from a file in a single call.
+
+    Args:
+        file (BinaryIO): The file to read from.
+        size (int): The number of bytes to read.
+        context (str): The type of data being read. Used for debugging.
 
-    # Ensure float read properly
-    if len(float_bytes) != 4:
+    Returns:
+        bytes: The bytes read.
+    """
+
+    # Read block
+    block: bytes = file.read(size)
+
+    # Ensure block read properly
+    if len(block) != size:
         raise EOFError(f"Unexpected end-of-file while reading {context}.")
 
-    # Convert bytes to float
-    return struct.unpack('<f', float_bytes)[0]
+    # Return block
+    return block
 
-def read_string(file: BinaryIO,
-                context: str = 'string data') -> str:
+def read_struct(file: BinaryIO,
+                layout: struct.Struct,
+                context: str = 'struct data') -> tuple:
     """
-    Reads an integer and string from a file and returns the string. Always ASCII.
+    Reads and unpacks a fixed-size struct from a file. Unpacks in place when reading from a _Cursor.
+
+    Args:
+        file (BinaryIO): The file to read from.
+        layout (Struct): The layout of the data.
+        context (str): The type of data being read. Used for debugging.
+
+    Returns:
+        tuple: The unpacked values.
+    """
+
+    # Unpack in place
+    if isinstance(file, _Cursor):
+        return file.unpack(layout, context)
+
+    # Read and unpack values
+    return layout.unpack(read_block(file, layout.size, context))
+
+def read_array(file: BinaryIO,
+               typecode: str,
+               count: int,
+               context: str = 'array data') -> array:
+    """
+    Reads a block of little-endian values from a file into an array.
+
+    Args:
+        file (BinaryIO): The file to read from.
+        typecode (str): The array typecode of the values.
+        count (int): The number of values to read.
+        context (str): The type of data being read. Used for debugging.
+
+    Returns:
+        array: The values read.
+    """
+
+    # Create array
+    values: array = array(typecode)
+
+    # Read values
+    values.frombytes(read_block(file, count * values.itemsize, context))
+
+    # Convert from little-endian
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    # Return values
+    return values
+
+def group(values: array,
+          size: int) -> Iterator[tuple]:
+    """
+    Groups a flat array into tuples of consecutive values, such as the x, y, z of each position.
+
+    Args:
+        values (array): The flat values.
+        size (int): The number of values per group.
+
+    Returns:
+        Iterator[tuple]: The grouped values.
+    """
+
+    # Zip one shared iterator with itself
+    return zip(*[iter(values)] * size)
+
+def unpack_fields(data: bytes,
+                  record_size: int,
+                  offsets: tuple[int, ...],
+                  typecode: str) -> array:
+    """
+    Gathers the same fields out of every fixed-size record in a block into one array. The fields are copied with
+    strided slices, so no per-record Python work is done.
+
+    Args:
+        data (bytes): The block of little-endian records.
+        record_size (int): The size of a single record in bytes.
+        offsets (tuple[int, ...]): The byte offset of each field within a record, in output order.
+        typecode (str): The array typecode of the fields.
+
+    Returns:
+        array: The gathered values, with each record's fields next to each other.
+    """
+
+    # Create array
+    values: array = array(typecode)
+
+    # Get field layout
+    field_size: int = values.itemsize
+    width: int = len(offsets) * field_size
+
+    # Gather fields byte by byte
+    gathered: bytearray = bytearray(len(data) // record_size * width)
+    for index, offset in enumerate(offsets):
+        for byte in range(field_size):
+            gathered[index * field_size + byte::width] = data[offset + byte::record_size]
+
+    # Convert bytes to values
+    values.frombytes(gathered)
+
+    # Convert from little-endian
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    # Return values
+    return values
+
+def parse_list(file: BinaryIO,
+               item_class: type,
+               count: int) -> list:
+    """
+    Creates and parses a number of consecutive items of the same class from a file.
+
+    Args:
+        file (BinaryIO): The file to read from.
+        item_class (type): The class of the items. Must have a parse method and take no constructor arguments.
+        count (int): The number of items to parse.
+
+    Returns:
+        list: The parsed items.
+    """
+
+    # Create items
+    items: list = [item_class() for _ in range(count)]
+
+    # Parse items in file order
+    for item in items:
+        item.parse(file)
+
+    # Return items
+    return items
+
+def read_string_bytes(file: BinaryIO,
+                      context: str = 'string data') -> bytes:
+    """
+    Reads an integer and string from a file and returns the string's raw bytes, without decoding.
 
     Args:
         file (BinaryIO): The file to read from.
         context (str): The type of data being read. Used for debugging.
+
+    Returns:
+        bytes: The string bytes read.
     """
 
     # Read string length
     string_length: int = read_integer(file, context)
 
     # Read string
-    string_bytes: bytes = file.read(string_length)
+    return read_block(file, string_length, context)
 
-    # Ensure string read properly
-    if len(string_bytes) < string_length:
-        raise EOFError(f"Unexpected end-of-file while reading {context}.")
+def read_string(file: BinaryIO,
+                context: str = 'string data') -> str:
+    """
+    Reads an integer and string from a file and returns the string. Always ASCII.
+
+    Args:
+        file (BinaryIO): The file to read from.
+        context (str): The type of data being read. Used for debugging.
+    """
+
+    # Decode in place
+    if isinstance(file, _Cursor):
+        # Decode string, sharing one object between repeated strings
+        return sys.intern(file.decode(read_integer(file, context), context))
 
-    # Convert bytes to string
-    return string_bytes.decode('ascii')
+    # Read string
+    string_bytes: bytes = read_string_bytes(file, context)
+
+    # Convert bytes to string, sharing one object between repeated strings
+    return sys.intern(string_bytes.decode('ascii'))
 
 def write_byte(file: BinaryIO,
                value: int,
@@ -127,7 +440,7 @@ def write_byte(file: BinaryIO,
     """
 
     # Convert integer to bytes
-    value_bytes: bytes = struct.pack('B', value)
+    value_bytes: bytes = _BYTE_STRUCT.pack(value)
 
     # Write byte value
     if file.write(value_bytes) != 1:
@@ -171,12 +484,110 @@ def write_float(file: BinaryIO,
     """
 
     # Convert float to bytes
-    value_bytes: bytes = struct.pack('<f', value)
+    value_bytes: bytes = _FLOAT_STRUCT.pack(value)
 
     # Write float value
     if file.write(value_bytes) < 4:
         raise OSError(f"Unable to write float for {context}")
 
+def write_block(file: BinaryIO,
+                data: bytes,
+                context: str = 'block data') -> None:
+    """
+    Writes pre-packed binary data to a file in a single call.
+
+    Args:
+        file (BinaryIO): The file to write to.
+        data (bytes): The packed data to write.
+        context (str): The type of data being written. Used for debugging.
+
+    Returns:
+        None.
+    """
+
+    # Write packed data
+    if file.write(data) < len(data):
+        raise OSError(f"Unable to write block for {context}")
+
+def write_array(file: BinaryIO,
+                values: array,
+                context: str = 'array data') -> None:
+    """
+    Writes an array to a file as a block of little-endian values.
+
+    Args:
+        file (BinaryIO): The file to write to.
+        values (array): The values to write.
+        context (str): The type of data being written. Used for debugging.
+
+    Returns:
+        None.
+    """
+
+    # Convert to little-endian
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    # Write values
+    write_block(file, values.tobytes(), context)
+
+def pack_fields(data: bytearray,
+                record_size: int,
+                offsets: tuple[int, ...],
+                values: array) -> None:
+    """
+    Scatters an array into the same fields of every fixed-size record in a block. This is the reverse of
+    unpack_fields.
+
+    Args:
+        data (bytearray): The block of records to write into.
+        record_size (int): The size of a single record in bytes.
+        offsets (tuple[int, ...]): The byte offset of each field within a record, in array order.
+        values (array): The values to scatter, with each record's fields next to each other.
+
+    Returns:
+        None.
+    """
+
+    # Convert to little-endian
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    # Get field layout
+    field_size: int = values.itemsize
+    width: int = len(offsets) * field_size
+    value_bytes: bytes = values.tobytes()
+
+    # Ensure there is one set of fields per record
+    if len(value_bytes) // width != len(data) // record_size:
+        raise ValueError(f"Expected {len(data) // record_size} records, got {len(value_bytes) // width}.")
+
+    # Scatter fields byte by byte
+    for index, offset in enumerate(offsets):
+        for byte in range(field_size):
+            data[offset + byte::record_size] = value_bytes[index * field_size + byte::width]
+
+@lru_cache(maxsize=256)
+def encode_string(string: str) -> bytes:
+    """
+    Encodes a string with its length prefix. Cached, since texture filenames and point classnames repeat often
+    within a RoomMesh.
+
+    Args:
+        string (str): The string to encode.
+
+    Returns:
+        bytes: The length-prefixed ASCII string.
+    """
+
+    # Convert string to bytes
+    string_bytes: bytes = string.encode('ascii')
+
+    # Return string length and string
+    return _INTEGER_STRUCT.pack(len(string_bytes)) + string_bytes
+
 def write_string(file: BinaryIO,
                 string: str,
                 context: str = 'string data') -> None:
@@ -189,15 +600,8 @@ def write_string(file: BinaryIO,
         context (str): The type of data being written. Used for debugging.
     """
 
-    # Write string length
-    write_integer(file, len(string), f"{context} length")
-
-    # Convert string to bytes
-    string_bytes: bytes = string.encode('ascii')
-
-    # Write string
-    if file.write(string_bytes) < len(string):
-        raise OSError(f"Unable to write string for {context}")
+    # Write string length and string together
+    write_block(file, encode_string(string), context)
 
 # Define classes
 class Texture:
@@ -205,6 +609,9 @@ class Texture:
     Stores the data for a texture in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('layer_ID', 'filename')
+
     def __init__(self, layer_ID: int = 1,
                  filename: str = '') -> None:
         """
@@ -272,6 +679,9 @@ class Coordinate3:
     Stores the data for a 3D coordinate in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('x', 'y', 'z')
+
     def __init__(self, x: float = 0.0,
                  y: float = 0.0,
                  z: float = 0.0) -> None:
@@ -336,9 +746,7 @@ class Coordinate3:
         """
 
         # Get position data
-        self.set_pos(x=read_float(file, 'x-position'),
-                     z=read_float(file, 'z-position'),
-                     y=read_float(file, 'y-position'))
+        self.x, self.z, self.y = read_struct(file, _COORDINATE_STRUCT, 'position')
 
     def write(self, file: BinaryIO) -> None:
         """
@@ -352,15 +760,16 @@ class Coordinate3:
         """
 
         # Write position data
-        write_float(file, self.x, 'x-position')
-        write_float(file, self.z, 'z-position')
-        write_float(file, self.y, 'y-position')
+        write_block(file, _COORDINATE_STRUCT.pack(self.x, self.z, self.y), 'position')
 
 class UV:
     """
     Stores the data for a UV coordinate in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('u', 'v')
+
     def __init__(self, u: float = 0.0,
                  v: float = 0.0) -> None:
         """
@@ -419,8 +828,7 @@ class UV:
         """
 
         # Get uv data
-        self.set_pos(read_float(file, 'u-position'),
-                     read_float(file, 'v-position'))
+        self.u, self.v = read_struct(file, _UV_STRUCT, 'uv position')
 
     def write(self, file: BinaryIO) -> None:
         """
@@ -434,14 +842,16 @@ class UV:
         """
 
         # Write UV data
-        write_float(file, self.u, 'u-position')
-        write_float(file, self.v, 'v-position')
+        write_block(file, _UV_STRUCT.pack(self.u, self.v), 'uv position')
 
 class Color:
     """
     Stores the data for a color in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('r', 'g', 'b')
+
     def __init__(self, r: int = 0,
                  g: int = 0,
                  b: int = 0) -> None:
@@ -506,9 +916,7 @@ class Color:
         """
 
         # Get color data
-        self.set_rgb(read_byte(file, 'red value'),
-                     read_byte(file, 'green value'),
-                     read_byte(file, 'blue value'))
+        self.r, self.g, self.b = read_struct(file, _COLOR_STRUCT, 'color values')
 
     def parse_as_string(self, file: BinaryIO) -> None:
         """
@@ -521,9 +929,9 @@ class Color:
             None.
         """
 
-        # Get color data
-        color_string: str = read_string(file, 'color string')
-        self.set_rgb(*map(int, color_string.split()))
+        # Get color data without decoding, since int() accepts ASCII bytes
+        color_string: bytes = read_string_bytes(file, 'color string')
+        self.r, self.g, self.b = map(int, color_string.split())
 
     def write_as_bytes(self, file: BinaryIO) -> None:
         """
@@ -537,9 +945,7 @@ class Color:
         """
 
         # Write color data
-        write_byte(file, self.r, 'red value')
-        write_byte(file, self.g, 'green value')
-        write_byte(file, self.b, 'blue value')
+        write_block(file, _COLOR_STRUCT.pack(self.r, self.g, self.b), 'color values')
 
     def write_as_string(self, file: BinaryIO) -> None:
         """
@@ -561,6 +967,9 @@ class Angle:
     Stores the data for an angle in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('pitch', 'yaw', 'roll')
+
     def __init__(self, pitch: float = 0.0,
                  yaw: float = 0.0,
                  roll: float = 0.0) -> None:
@@ -625,9 +1034,7 @@ class Angle:
         """
 
         # Get angle data
-        self.set_angle(read_float(file, 'pitch value'),
-                       read_float(file, 'yaw value'),
-                       read_float(file, 'roll value'))
+        self.pitch, self.yaw, self.roll = read_struct(file, _COORDINATE_STRUCT, 'angle values')
 
     def parse_as_string(self, file: BinaryIO) -> None:
         """
@@ -641,9 +1048,9 @@ class Angle:
             None.
         """
 
-        # Get angle data
-        angle_string: str = read_string(file, 'angle string')
-        self.set_angle(*map(int, angle_string.split()))
+        # Get angle data without decoding, since int() accepts ASCII bytes
+        angle_string: bytes = read_string_bytes(file, 'angle string')
+        self.pitch, self.yaw, self.roll = map(int, angle_string.split())
 
     def write_as_bytes(self, file: BinaryIO) -> None:
         """
@@ -657,9 +1064,7 @@ class Angle:
         """
 
         # Write angle data
-        write_float(file, self.pitch, 'pitch value')
-        write_float(file, self.yaw, 'yaw value')
-        write_float(file, self.roll, 'roll value')
+        write_block(file, _COORDINATE_STRUCT.pack(self.pitch, self.yaw, self.roll), 'angle values')
 
     def write_as_string(self, file: BinaryIO) -> None:
         """
@@ -682,6 +1087,9 @@ class Scale:
     Stores the data for a 3D scale in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('x_scale', 'y_scale', 'z_scale')
+
     def __init__(self, x_scale: float = 1.0,
                  y_scale: float = 1.0,
                  z_scale: float = 1.0) -> None:
@@ -746,9 +1154,7 @@ class Scale:
         """
 
         # Get scale data
-        self.set_scale(read_float(file, 'x-scale'),
-                     read_float(file, 'y-scale'),
-                     read_float(file, 'z-scale'))
+        self.x_scale, self.y_scale, self.z_scale = read_struct(file, _COORDINATE_STRUCT, 'scale values')
 
     def write(self, file: BinaryIO) -> None:
         """
@@ -762,28 +1168,38 @@ class Scale:
         """
 
         # Write scale data
-        write_float(file, self.x_scale, 'x-scale')
-        write_float(file, self.y_scale, 'y-scale')
-        write_float(file, self.z_scale, 'z-scale')
+        write_block(file, _COORDINATE_STRUCT.pack(self.x_scale, self.y_scale, self.z_scale), 'scale values')
 
 class Vertex:
     """
     Stores data for a vertex in a RoomMesh file.
     """
 
-    def __init__(self) -> None:
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('pos', 'uv_1', 'uv_2', 'color')
+
+    def __init__(self, pos: Coordinate3 | None = None,
+                 uv_1: UV | None = None,
+                 uv_2: UV | None = None,
+                 color: Color | None = None) -> None:
         """
         Creates a Vertex instance.
 
+        Args:
+            pos (Coordinate3 | None): The position of the Vertex.
+            uv_1 (UV | None): The diffuse UV of the Vertex.
+            uv_2 (UV | None): The lightmap UV of the Vertex.
+            color (Color | None): The color of the Vertex.
+
         Returns:
             None.
         """
 
         # Define Vertex attributes
-        self.pos: Coordinate3 = Coordinate3()
-        self.uv_1: UV = UV()
-        self.uv_2: UV = UV()
-        self.color: Color = Color()
+        self.pos: Coordinate3 = pos or Coordinate3()
+        self.uv_1: UV = uv_1 or UV()
+        self.uv_2: UV = uv_2 or UV()
+        self.color: Color = color or Color()
 
     def set_pos(self, x: float,
                 y: float,
@@ -866,15 +1282,11 @@ class Vertex:
             None.
         """
 
-        # Parse coordinate data
-        self.pos.parse(file)
-
-        # Parse UV data
-        self.uv_1.parse(file)
-        self.uv_2.parse(file)
-
-        # Parse color data
-        self.color.parse_as_bytes(file)
+        # Read and unpack the full vertex record
+        (self.pos.x, self.pos.z, self.pos.y,
+         self.uv_1.u, self.uv_1.v,
+         self.uv_2.u, self.uv_2.v,
+         self.color.r, self.color.g, self.color.b) = read_struct(file, _VERTEX_STRUCT, 'vertex data')
 
     def write(self, file: BinaryIO):
         """
@@ -887,33 +1299,39 @@ class Vertex:
             None.
         """
 
-        # Write position data
-        self.pos.write(file)
-
-        # Write UV data
-        self.uv_1.write(file)
-        self.uv_2.write(file)
-
-        # Write color data
-        self.color.write_as_bytes(file)
+        # Pack and write the full vertex record
+        write_block(file, _VERTEX_STRUCT.pack(self.pos.x, self.pos.z, self.pos.y,
+                                              self.uv_1.u, self.uv_1.v,
+                                              self.uv_2.u, self.uv_2.v,
+                                              self.color.r, self.color.g, self.color.b), 'vertex data')
 
 class Triangle:
     """
     Stores data for a triangle in a RoomMesh file.
     """
 
-    def __init__(self) -> None:
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('index_1', 'index_2', 'index_3')
+
+    def __init__(self, index_1: int = 0,
+                 index_2: int = 0,
+                 index_3: int = 0) -> None:
         """
         Creates a Triangle instance.
 
+        Args:
+            index_1 (int): The index of the first vertex.
+            index_2 (int): The index of the second vertex.
+            index_3 (int): The index of the third vertex.
+
         Returns:
             None.
         """
 
         # Save Triangle attributes
-        self.index_1: int = 0
-        self.index_2: int = 0
-        self.index_3: int = 0
+        self.index_1: int = index_1
+        self.index_2: int = index_2
+        self.index_3: int = index_3
 
     @property
     def indices(self) -> tuple[int, int, int]:
@@ -959,9 +1377,7 @@ class Triangle:
         """
 
         # Get vertex index data
-        self.set_indices(read_integer(file, "triangle index 1"),
-                         read_integer(file, "triangle index 2"),
-                         read_integer(file, "triangle index 3"))
+        self.index_1, self.index_2, self.index_3 = read_struct(file, _TRIANGLE_STRUCT, 'triangle indices')
 
     def write(self, file: BinaryIO) -> None:
         """
@@ -975,65 +1391,619 @@ class Triangle:
         """
 
         # Write vertex index data
-        write_integer(file, self.index_1)
-        write_integer(file, self.index_2)
-        write_integer(file, self.index_3)
+        write_block(file, _TRIANGLE_STRUCT.pack(self.index_1, self.index_2, self.index_3), 'triangle indices')
 
-class Object:
+# Define array views
+def array_property(index: int) -> property:
     """
-    Stores data for an object in a RoomMesh file.
+    Creates a property that reads and writes one value of a record stored in a flat array.
+
+    Args:
+        index (int): The position of the value within the record.
+
+    Returns:
+        property: The array-backed property.
     """
 
-    def __init__(self) -> None:
-        """
-        Creates an Object instance.
+    def get_value(self) -> float | int:
+        # Return value from owner's array
+        return getattr(self._owner, self._field)[self._offset + index]
 
-        Returns:
-            None.
-        """
+    def set_value(self, value: float | int) -> None:
+        # Write value into owner's array
+        getattr(self._owner, self._field)[self._offset + index] = value
 
-        # Define Object attributes
-        self.textures: list[Texture] = []
-        self.vertices: list[Vertex] = []
-        self.triangles: list[Triangle] = []
+    # Return property
+    return property(get_value, set_value)
 
-    def parse(self, file: BinaryIO) -> None:
+class ArrayRecord:
+    """
+    Base class for values whose fields live in a flat array of their owner, so changes are written back.
+    """
+
+    # Define attribute slots, declared by each subclass to avoid a layout conflict with the value class
+    __slots__: tuple[str, ...] = ()
+
+    def __init__(self, owner: object,
+                 field: str,
+                 offset: int) -> None:
         """
-        Parses the object data from a RoomMesh file.
+        Creates an ArrayRecord instance.
 
         Args:
-            file (BinaryIO): The RoomMesh file opened in binary read mode.
+            owner (object): The object holding the array.
+            field (str): The name of the array attribute.
+            offset (int): The index of the first value in the array.
 
         Returns:
             None.
         """
 
-        # Get textures
-        for _ in range(2):
-            # Get texture
-            texture: Texture = Texture()
-            texture.parse(file)
-            self.textures.append(texture)
+        # Define view attributes
+        self._owner: object = owner
+        self._field: str = field
+        self._offset: int = offset
+
+class ArrayCoordinate3(ArrayRecord, Coordinate3):
+    """
+    A Coordinate3 whose values live in a flat array of its owner, so changes are written back.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('_owner', '_field', '_offset')
+
+    # Define array-backed attributes
+    x = array_property(0)
+    y = array_property(1)
+    z = array_property(2)
+
+class ArrayUV(ArrayRecord, UV):
+    """
+    A UV whose values live in a flat array of its owner, so changes are written back.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('_owner', '_field', '_offset')
+
+    # Define array-backed attributes
+    u = array_property(0)
+    v = array_property(1)
+
+class ArrayColor(ArrayRecord, Color):
+    """
+    A Color whose values live in a flat array of its owner, so changes are written back.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('_owner', '_field', '_offset')
+
+    # Define array-backed attributes
+    r = array_property(0)
+    g = array_property(1)
+    b = array_property(2)
+
+class ArrayTriangle(ArrayRecord, Triangle):
+    """
+    A Triangle whose indices live in a flat array of its owner, so changes are written back.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('_owner', '_field', '_offset')
+
+    # Define array-backed attributes
+    index_1 = array_property(0)
+    index_2 = array_property(1)
+    index_3 = array_property(2)
+
+class ArrayVertex(Vertex):
+    """
+    A Vertex whose position, UVs and color live in the flat arrays of an Object, so changes are written back.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('_owner', '_index')
+
+    def __init__(self, owner: 'Object',
+                 index: int) -> None:
+        """
+        Creates an ArrayVertex instance.
+
+        Args:
+            owner (Object): The Object holding the vertex arrays.
+            index (int): The index of the vertex.
+
+        Returns:
+            None.
+        """
+
+        # Define view attributes
+        self._owner: Object = owner
+        self._index: int = index
+
+    @property
+    def pos(self) -> ArrayCoordinate3:
+        """
+        Returns the position of the Vertex, backed by the Object's positions.
+
+        Returns:
+            ArrayCoordinate3: The position of the Vertex.
+        """
+
+        # Return position view
+        return ArrayCoordinate3(self._owner, 'positions', self._index * 3)
+
+    @pos.setter
+    def pos(self, pos: Coordinate3) -> None:
+        # Copy position into array
+        self.pos.set_pos(*pos.pos)
+
+    @property
+    def uv_1(self) -> ArrayUV:
+        """
+        Returns the diffuse UV of the Vertex, backed by the Object's first UVs.
+
+        Returns:
+            ArrayUV: The diffuse UV of the Vertex.
+        """
+
+        # Return UV view
+        return ArrayUV(self._owner, 'uvs_1', self._index * 2)
+
+    @uv_1.setter
+    def uv_1(self, uv: UV) -> None:
+        # Copy UV into array
+        self.uv_1.set_pos(*uv.pos)
+
+    @property
+    def uv_2(self) -> ArrayUV:
+        """
+        Returns the lightmap UV of the Vertex, backed by the Object's second UVs.
+
+        Returns:
+            ArrayUV: The lightmap UV of the Vertex.
+        """
+
+        # Return UV view
+        return ArrayUV(self._owner, 'uvs_2', self._index * 2)
+
+    @uv_2.setter
+    def uv_2(self, uv: UV) -> None:
+        # Copy UV into array
+        self.uv_2.set_pos(*uv.pos)
+
+    @property
+    def color(self) -> ArrayColor:
+        """
+        Returns the color of the Vertex, backed by the Object's colors.
+
+        Returns:
+            ArrayColor: The color of the Vertex.
+        """
+
+        # Return color view
+        return ArrayColor(self._owner, 'colors', self._index * 3)
+
+    @color.setter
+    def color(self, color: Color) -> None:
+        # Copy color into array
+        self.color.set_rgb(*color.rgb)
+
+class ArrayView(MutableSequence):
+    """
+    Base class for list-like views over records stored in flat arrays. Items are views themselves, so reading,
+    editing, appending and removing through the view changes the owner's arrays.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('_owner',)
+
+    # Define the owner's arrays as (attribute, typecode, values per record)
+    _fields: tuple[tuple[str, str, int], ...] = ()
+
+    def __init__(self, owner: object) -> None:
+        """
+        Creates an ArrayView instance.
+
+        Args:
+            owner (object): The object holding the arrays.
+
+        Returns:
+            None.
+        """
+
+        # Define view attributes
+        self._owner: object = owner
+
+    def _item(self, index: int) -> object:
+        """
+        Creates an array-backed item for a record. Implemented by each view.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            object: The array-backed item.
+        """
+        pass
+
+    def _copy(self, index: int) -> object:
+        """
+        Creates a standalone copy of a record. Implemented by each view.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            object: The copied item.
+        """
+        pass
+
+    def _values(self, item: object) -> tuple[tuple, ...]:
+        """
+        Gets the values of an item for each of the owner's arrays. Implemented by each view.
+
+        Args:
+            item (object): The item to read.
+
+        Returns:
+            tuple[tuple, ...]: The values of the item, one tuple per array.
+        """
+        pass
+
+    def _check_index(self, index: int) -> int:
+        """
+        Converts a possibly negative index into a record index, ensuring it is in range.
+
+        Args:
+            index (int): The index to check.
+
+        Returns:
+            int: The record index.
+        """
+
+        # Get record count
+        count: int = len(self)
+
+        # Wrap negative index
+        if index < 0:
+            index += count
+
+        # Ensure index is in range
+        if not 0 <= index < count:
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        # Return index
+        return index
+
+    def __len__(self) -> int:
+        # Return record count from the first array
+        name, _, size = self._fields[0]
+        return len(getattr(self._owner, name)) // size
+
+    def __getitem__(self, index: int | slice) -> object | list:
+        # Return items for slices
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+
+        # Return item
+        return self._item(self._check_index(index))
+
+    def __setitem__(self, index: int, item: object) -> None:
+        # Ensure index is a single record
+        if isinstance(index, slice):
+            raise TypeError(f"{type(self).__name__} does not support slice assignment")
+
+        # Get record index
+        index = self._check_index(index)
+
+        # Write values into each array
+        for (name, typecode, size), values in zip(self._fields, self._values(item)):
+            getattr(self._owner, name)[index * size:(index + 1) * size] = array(typecode, values)
+
+    def __delitem__(self, index: int | slice) -> None:
+        # Get record indices, removing from the back so earlier indices stay valid
+        if isinstance(index, slice):
+            indices: list[int] = sorted(range(*index.indices(len(self))), reverse=True)
+        else:
+            indices: list[int] = [self._check_index(index)]
+
+        # Remove values from each array
+        for record in indices:
+            for name, _, size in self._fields:
+                del getattr(self._owner, name)[record * size:(record + 1) * size]
+
+    def insert(self, index: int, item: object) -> None:
+        # Clamp index like list.insert
+        count: int = len(self)
+        if index < 0:
+            index = max(0, index + count)
+        index = min(index, count)
+
+        # Insert values into each array
+        for (name, typecode, size), values in zip(self._fields, self._values(item)):
+            getattr(self._owner, name)[index * size:index * size] = array(typecode, values)
+
+    def pop(self, index: int = -1) -> object:
+        # Copy item before its values are removed
+        item: object = self._copy(self._check_index(index))
+        del self[index]
+
+        # Return item
+        return item
+
+    def reverse(self) -> None:
+        # Copy items before their values are moved
+        items: list = [self._copy(index) for index in range(len(self))]
+
+        # Write items back in reverse order
+        for index, item in enumerate(reversed(items)):
+            self[index] = item
+
+    def __repr__(self) -> str:
+        # Return copied records
+        return f"{type(self).__name__}({[self._copy(index) for index in range(len(self))]!r})"
+
+class VertexView(ArrayView):
+    """
+    A list-like view over the vertex arrays of an Object.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ()
+
+    # Define vertex arrays
+    _fields: tuple[tuple[str, str, int], ...] = (('positions', 'f', 3), ('uvs_1', 'f', 2), ('uvs_2', 'f', 2),
+                                                 ('colors', 'B', 3))
+
+    def _item(self, index: int) -> ArrayVertex:
+        # Return array-backed vertex
+        return ArrayVertex(self._owner, index)
+
+    def _copy(self, index: int) -> Vertex:
+        # Return standalone vertex
+        vertex: ArrayVertex = self._item(index)
+        return Vertex(Coordinate3(*vertex.pos.pos), UV(*vertex.uv_1.pos), UV(*vertex.uv_2.pos),
+                      Color(*vertex.color.rgb))
+
+    def _values(self, item: Vertex) -> tuple[tuple, ...]:
+        # Return vertex values
+        return item.pos.pos, item.uv_1.pos, item.uv_2.pos, item.color.rgb
+
+    def append(self, item: Vertex) -> None:
+        # Append through the Object
+        self._owner.add_vertex(item)
+
+class PositionView(ArrayView):
+    """
+    A list-like view over the vertex positions of a Collision.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ()
+
+    # Define position array
+    _fields: tuple[tuple[str, str, int], ...] = (('positions', 'f', 3),)
+
+    def _item(self, index: int) -> ArrayCoordinate3:
+        # Return array-backed position
+        return ArrayCoordinate3(self._owner, 'positions', index * 3)
+
+    def _copy(self, index: int) -> Coordinate3:
+        # Return standalone position
+        return Coordinate3(*self._item(index).pos)
+
+    def _values(self, item: Coordinate3) -> tuple[tuple, ...]:
+        # Return position values
+        return (item.pos,)
+
+    def append(self, item: Coordinate3) -> None:
+        # Append through the Collision
+        self._owner.add_vertex(item)
+
+class TriangleView(ArrayView):
+    """
+    A list-like view over the triangle indices of an Object or Collision.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ()
+
+    # Define index array
+    _fields: tuple[tuple[str, str, int], ...] = (('indices', 'I', 3),)
+
+    def _item(self, index: int) -> ArrayTriangle:
+        # Return array-backed triangle
+        return ArrayTriangle(self._owner, 'indices', index * 3)
+
+    def _copy(self, index: int) -> Triangle:
+        # Return standalone triangle
+        return Triangle(*self._item(index).indices)
+
+    def _values(self, item: Triangle) -> tuple[tuple, ...]:
+        # Return triangle values
+        return (item.indices,)
+
+    def append(self, item: Triangle) -> None:
+        # Append through the owner
+        self._owner.add_triangle(item)
+
+class Object:
+    """
+    Stores data for an object in a RoomMesh file. Vertex and triangle data is stored as flat arrays, one per
+    attribute, instead of one Python object per element.
+    """
+
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('textures', 'positions', 'uvs_1', 'uvs_2', 'colors', 'indices')
+
+    def __init__(self) -> None:
+        """
+        Creates an Object instance.
+
+        Returns:
+            None.
+        """
+
+        # Define Object attributes
+        self.textures: list[Texture] = []
+        self.positions: array = array('f')
+        self.uvs_1: array = array('f')
+        self.uvs_2: array = array('f')
+        self.colors: array = array('B')
+        self.indices: array = array('I')
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Returns the number of vertices in the Object.
+
+        Returns:
+            int: The vertex count.
+        """
+
+        # Return vertex count
+        return len(self.positions) // 3
+
+    @property
+    def triangle_count(self) -> int:
+        """
+        Returns the number of triangles in the Object.
+
+        Returns:
+            int: The triangle count.
+        """
+
+        # Return triangle count
+        return len(self.indices) // 3
+
+    @property
+    def vertices(self) -> VertexView:
+        """
+        Returns a list-like view of the Object's vertices. Changes made through the view or its vertices are written
+        back to the vertex arrays.
+
+        Returns:
+            VertexView: The vertices of the Object.
+        """
+
+        # Return vertex view
+        return VertexView(self)
+
+    @vertices.setter
+    def vertices(self, vertices: list[Vertex]) -> None:
+        """
+        Sets the Object's vertex data from Vertex instances.
+
+        Args:
+            vertices (list[Vertex]): The vertices of the Object.
+
+        Returns:
+            None.
+        """
+
+        # Copy vertices so views and iterators are only read once
+        vertices = [(vertex.pos.pos, vertex.uv_1.pos, vertex.uv_2.pos, vertex.color.rgb) for vertex in vertices]
+
+        # Set vertex data
+        self.positions = array('f', chain.from_iterable(vertex[0] for vertex in vertices))
+        self.uvs_1 = array('f', chain.from_iterable(vertex[1] for vertex in vertices))
+        self.uvs_2 = array('f', chain.from_iterable(vertex[2] for vertex in vertices))
+        self.colors = array('B', chain.from_iterable(vertex[3] for vertex in vertices))
+
+    @property
+    def triangles(self) -> TriangleView:
+        """
+        Returns a list-like view of the Object's triangles. Changes made through the view or its triangles are
+        written back to the index array.
+
+        Returns:
+            TriangleView: The triangles of the Object.
+        """
+
+        # Return triangle view
+        return TriangleView(self)
+
+    @triangles.setter
+    def triangles(self, triangles: list[Triangle]) -> None:
+        """
+        Sets the Object's triangle data from Triangle instances.
+
+        Args:
+            triangles (list[Triangle]): The triangles of the Object.
+
+        Returns:
+            None.
+        """
+
+        # Set triangle data
+        self.indices = array('I', chain.from_iterable(triangle.indices for triangle in triangles))
+
+    def add_vertex(self, vertex: Vertex) -> None:
+        """
+        Appends a vertex to the Object.
+
+        Args:
+            vertex (Vertex): The vertex to add.
+
+        Returns:
+            None.
+        """
+
+        # Append vertex data
+        self.positions.extend(vertex.pos.pos)
+        self.uvs_1.extend(vertex.uv_1.pos)
+        self.uvs_2.extend(vertex.uv_2.pos)
+        self.colors.extend(vertex.color.rgb)
+
+    def add_triangle(self, triangle: Triangle) -> None:
+        """
+        Appends a triangle to the Object.
+
+        Args:
+            triangle (Triangle): The triangle to add.
+
+        Returns:
+            None.
+        """
+
+        # Append triangle data
+        self.indices.extend(triangle.indices)
+
+    def parse(self, file: BinaryIO) -> None:
+        """
+        Parses the object data from a RoomMesh file.
+
+        Args:
+            file (BinaryIO): The RoomMesh file opened in binary read mode.
+
+        Returns:
+            None.
+        """
+
+        # Get textures
+        for _ in range(2):
+            # Get texture
+            texture: Texture = Texture()
+            texture.parse(file)
+            self.textures.append(texture)
 
         # Get vertex count
         vertex_count: int = read_integer(file, 'object vertex count')
 
-        # Get vertices
-        for _ in range(vertex_count):
-            # Get vertex
-            vertex: Vertex = Vertex()
-            vertex.parse(file)
-            self.vertices.append(vertex)
+        # Read all vertex records at once
+        vertex_data: bytes = read_block(file, vertex_count * _VERTEX_STRUCT.size, 'object vertices')
+
+        # Split vertex records into attribute arrays
+        self.positions = unpack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_POSITION_OFFSETS, 'f')
+        self.uvs_1 = unpack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_UV_1_OFFSETS, 'f')
+        self.uvs_2 = unpack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_UV_2_OFFSETS, 'f')
+        self.colors = unpack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_COLOR_OFFSETS, 'B')
 
         # Get triangle count
         triangle_count: int = read_integer(file, 'object triangle count')
 
         # Get triangles
-        for _ in range(triangle_count):
-            # Get triangle
-            triangle: Triangle = Triangle()
-            triangle.parse(file)
-            self.triangles.append(triangle)
+        self.indices = read_array(file, 'I', triangle_count * 3, 'object triangles')
 
     def write(self, file: BinaryIO) -> None:
         """
@@ -1046,34 +2016,40 @@ class Object:
             None.
         """
 
-        # Ensure object has the correct number of textures
-        while len(self.textures) < 2:
-            # Append empty texture
-            self.textures.insert(0, Texture())
+        # Pad with empty textures to the correct number of textures
+        padding: list[Texture] = [Texture() for _ in range(2 - len(self.textures))]
 
         # Write textures
-        for texture in self.textures:
+        for texture in padding + self.textures:
             texture.write(file)
 
         # Write vertex count
-        write_integer(file, len(self.vertices), 'object vertex count')
+        write_integer(file, self.vertex_count, 'object vertex count')
+
+        # Merge attribute arrays into vertex records
+        vertex_data: bytearray = bytearray(self.vertex_count * _VERTEX_STRUCT.size)
+        pack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_POSITION_OFFSETS, self.positions)
+        pack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_UV_1_OFFSETS, self.uvs_1)
+        pack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_UV_2_OFFSETS, self.uvs_2)
+        pack_fields(vertex_data, _VERTEX_STRUCT.size, _VERTEX_COLOR_OFFSETS, self.colors)
 
-        # Write vertices
-        for vertex in self.vertices:
-            vertex.write(file)
+        # Write vertices in a single block
+        write_block(file, vertex_data, 'object vertices')
 
         # Write triangle count
-        write_integer(file, len(self.triangles), 'object triangle count')
+        write_integer(file, self.triangle_count, 'object triangle count')
 
-        # Write triangles
-        for triangle in self.triangles:
-            triangle.write(file)
+        # Write triangles in a single block
+        write_array(file, self.indices, 'object triangles')
 
 class Collision:
     """
-    Stores data for collision in a RoomMesh file.
+    Stores data for collision in a RoomMesh file. Vertex and triangle data is stored as flat arrays.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('positions', 'indices')
+
     def __init__(self) -> None:
         """
         Creates a Collision instance.
@@ -1083,8 +2059,116 @@ class Collision:
         """
 
         # Define collision attributes
-        self.vertices: list[Coordinate3] = []
-        self.triangles: list[Triangle] = []
+        self.positions: array = array('f')
+        self.indices: array = array('I')
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Returns the number of vertices in the Collision.
+
+        Returns:
+            int: The vertex count.
+        """
+
+        # Return vertex count
+        return len(self.positions) // 3
+
+    @property
+    def triangle_count(self) -> int:
+        """
+        Returns the number of triangles in the Collision.
+
+        Returns:
+            int: The triangle count.
+        """
+
+        # Return triangle count
+        return len(self.indices) // 3
+
+    @property
+    def vertices(self) -> PositionView:
+        """
+        Returns a list-like view of the Collision's vertex positions. Changes made through the view or its positions
+        are written back to the position array.
+
+        Returns:
+            PositionView: The vertices of the Collision.
+        """
+
+        # Return position view
+        return PositionView(self)
+
+    @vertices.setter
+    def vertices(self, vertices: list[Coordinate3]) -> None:
+        """
+        Sets the Collision's vertex positions from Coordinate3 instances.
+
+        Args:
+            vertices (list[Coordinate3]): The vertices of the Collision.
+
+        Returns:
+            None.
+        """
+
+        # Set vertex data
+        self.positions = array('f', chain.from_iterable(vertex.pos for vertex in vertices))
+
+    @property
+    def triangles(self) -> TriangleView:
+        """
+        Returns a list-like view of the Collision's triangles. Changes made through the view or its triangles are
+        written back to the index array.
+
+        Returns:
+            TriangleView: The triangles of the Collision.
+        """
+
+        # Return triangle view
+        return TriangleView(self)
+
+    @triangles.setter
+    def triangles(self, triangles: list[Triangle]) -> None:
+        """
+        Sets the Collision's triangle data from Triangle instances.
+
+        Args:
+            triangles (list[Triangle]): The triangles of the Collision.
+
+        Returns:
+            None.
+        """
+
+        # Set triangle data
+        self.indices = array('I', chain.from_iterable(triangle.indices for triangle in triangles))
+
+    def add_vertex(self, vertex: Coordinate3) -> None:
+        """
+        Appends a vertex position to the Collision.
+
+        Args:
+            vertex (Coordinate3): The vertex position to add.
+
+        Returns:
+            None.
+        """
+
+        # Append vertex data
+        self.positions.extend(vertex.pos)
+
+    def add_triangle(self, triangle: Triangle) -> None:
+        """
+        Appends a triangle to the Collision.
+
+        Args:
+            triangle (Triangle): The triangle to add.
+
+        Returns:
+            None.
+        """
+
+        # Append triangle data
+        self.indices.extend(triangle.indices)
 
     def parse(self, file: BinaryIO) -> None:
         """
@@ -1100,22 +2184,17 @@ class Collision:
         # Get vertex count
         vertex_count: int = read_integer(file, 'collision vertex count')
 
-        # Get vertices
-        for _ in range(vertex_count):
-            # Get vertex
-            vertex: Coordinate3 = Coordinate3()
-            vertex.parse(file)
-            self.vertices.append(vertex)
+        # Read all vertex records at once
+        vertex_data: bytes = read_block(file, vertex_count * _COORDINATE_STRUCT.size, 'collision vertices')
+
+        # Reorder vertex records into positions
+        self.positions = unpack_fields(vertex_data, _COORDINATE_STRUCT.size, _COORDINATE_OFFSETS, 'f')
 
         # Get triangle count
         triangle_count: int = read_integer(file, 'collision triangle count')
 
         # Get triangles
-        for _ in range(triangle_count):
-            # Get triangle
-            triangle: Triangle = Triangle()
-            triangle.parse(file)
-            self.triangles.append(triangle)
+        self.indices = read_array(file, 'I', triangle_count * 3, 'collision triangles')
 
     def write(self, file: BinaryIO) -> None:
         """
@@ -1129,26 +2208,71 @@ class Collision:
         """
 
         # Write vertex count
-        write_integer(file, len(self.vertices), 'collision vertex count')
+        write_integer(file, self.vertex_count, 'collision vertex count')
+
+        # Reorder positions into vertex records
+        vertex_data: bytearray = bytearray(self.vertex_count * _COORDINATE_STRUCT.size)
+        pack_fields(vertex_data, _COORDINATE_STRUCT.size, _COORDINATE_OFFSETS, self.positions)
 
-        # Write vertices
-        for vertex in self.vertices:
-            # Write vertex
-            vertex.write(file)
+        # Write vertices in a single block
+        write_block(file, vertex_data, 'collision vertices')
 
         # Write triangle count
-        write_integer(file, len(self.triangles), 'collision triangle count')
+        write_integer(file, self.triangle_count, 'collision triangle count')
+
+        # Write triangles in a single block
+        write_array(file, self.indices, 'collision triangles')
+
+    def info(self,
+             indent: str = '\t',
+             cache: dict | None = None) -> str:
+        """
+        Formats the collision data in a human-readable format. Collisions with identical geometry are often repeated
+        within a room, so the result can be shared through a cache keyed on the raw arrays.
+
+        Args:
+            indent (str): The indent to start each line with.
+            cache (dict | None): The formatted collisions seen so far, if any.
+
+        Returns:
+            str: The formatted collision data.
+        """
+
+        # Check for identical collision already formatted
+        key: tuple = (indent, self.positions.tobytes(), self.indices.tobytes())
+        if cache is not None and key in cache:
+            return cache[key]
 
-        # Write triangles
-        for triangle in self.triangles:
-            # Write triangle
-            triangle.write(file)
+        # Format vertices
+        lines: list[str] = [f"{indent}Vertex count: {self.vertex_count}\n"]
+        lines.extend(f"{indent}Vertex {vert_index}:\n"
+                     f"{indent}\tPosition: {pos}\n"
+                     for vert_index, pos in enumerate(group(self.positions, 3)))
+        lines.append("\n")
+
+        # Format triangles
+        lines.append(f"{indent}Triangle count: {self.triangle_count}\n")
+        lines.extend(f"{indent}Triangle {tri_index}\n"
+                     f"{indent}\tVertex indices: {indices}\n"
+                     for tri_index, indices in enumerate(group(self.indices, 3)))
+        lines.append("\n")
+
+        # Store formatted collision
+        info: str = ''.join(lines)
+        if cache is not None:
+            cache[key] = info
+
+        # Return collision info
+        return info
 
 class TriggerBox:
     """
     Stores data for a trigger box in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('collisions', 'name')
+
     def __init__(self) -> None:
         """
         Creates a TriggerBox instance.
@@ -1176,11 +2300,7 @@ class TriggerBox:
         collision_count: int = read_integer(file, 'trigger box collision count')
 
         # Get collisions
-        for _ in range(collision_count):
-            # Get collision
-            collision: Collision = Collision()
-            collision.parse(file)
-            self.collisions.append(collision)
+        self.collisions.extend(parse_list(file, Collision, collision_count))
 
         # Get trigger name
         self.name = read_string(file, 'trigger box name')
@@ -1212,6 +2332,9 @@ class Point:
     Base class for all Point objects. Primarily for typing.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('classname', 'pos')
+
     def __init__(self, classname: str) -> None:
         """
         Creates a Point instance.
@@ -1227,10 +2350,9 @@ class Point:
         self.classname: str = classname
         self.pos: Coordinate3 = Coordinate3()
 
-    @abstractmethod
     def parse(self, file: BinaryIO) -> None:
         """
-        Abstract method for parsing point data.
+        Parses point data. Overridden by each point type, the base point has no data to parse.
 
         Args:
             file (BinaryIO): The RoomMesh file opened in binary read mode.
@@ -1240,10 +2362,9 @@ class Point:
         """
         pass
 
-    @abstractmethod
     def write(self, file: BinaryIO) -> None:
         """
-        Abstract method for writing point data.
+        Writes point data. Overridden by each point type, the base point has no data to write.
 
         Args:
             file (BinaryIO): The RoomMesh file opened in binary write mode.
@@ -1253,11 +2374,25 @@ class Point:
         """
         pass
 
+    def info(self) -> str:
+        """
+        Formats point data. Overridden by each point type, the base point is not listed.
+
+        Returns:
+            str: The formatted point data.
+        """
+
+        # Return empty info
+        return ''
+
 class Screen(Point):
     """
     Stores data for a screen point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('path',)
+
     def __init__(self) -> None:
         """
         Creates a Screen instance.
@@ -1310,11 +2445,26 @@ class Screen(Point):
         # Write image path
         write_string(file, self.path, 'screen image path')
 
+    def info(self) -> str:
+        """
+        Formats the screen data in a human-readable format.
+
+        Returns:
+            str: The formatted screen data.
+        """
+
+        # Return screen info
+        return (f"\tPosition: {self.pos}\n"
+                f"\tImage: {self.path}\n")
+
 class Waypoint(Point):
     """
     Stores data for a waypoint point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ()
+
     def __init__(self) -> None:
         """
         Creates a Waypoint instance.
@@ -1360,11 +2510,25 @@ class Waypoint(Point):
         # Write position
         self.pos.write(file)
 
+    def info(self) -> str:
+        """
+        Formats the waypoint data in a human-readable format.
+
+        Returns:
+            str: The formatted waypoint data.
+        """
+
+        # Return waypoint info
+        return f"\tPosition: {self.pos}\n"
+
 class Light(Point):
     """
     Stores data for a light point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('range', 'color', 'intensity')
+
     def __init__(self) -> None:
         """
         Creates a Light instance.
@@ -1431,11 +2595,28 @@ class Light(Point):
         # Write intensity
         write_float(file, self.intensity, 'light intensity')
 
+    def info(self) -> str:
+        """
+        Formats the light data in a human-readable format.
+
+        Returns:
+            str: The formatted light data.
+        """
+
+        # Return light info
+        return (f"\tPosition: {self.pos}\n"
+                f"\tIntensity: {self.intensity}\n"
+                f"\tRange: {self.range}\n"
+                f"\tColor: {self.color.rgb}\n")
+
 class Spotlight(Point):
     """
     Stores data for a light point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('range', 'color', 'intensity', 'angle', 'inner_angle', 'outer_angle')
+
     def __init__(self) -> None:
         """
         Creates a Spotlight instance.
@@ -1523,11 +2704,31 @@ class Spotlight(Point):
         # Write outer cone angle
         write_integer(file, self.outer_angle, 'spotlight outer angle')
 
+    def info(self) -> str:
+        """
+        Formats the spotlight data in a human-readable format.
+
+        Returns:
+            str: The formatted spotlight data.
+        """
+
+        # Return spotlight info
+        return (f"\tPosition: {self.pos}\n"
+                f"\tIntensity: {self.intensity}\n"
+                f"\tRange: {self.range}\n"
+                f"\tColor: {self.color.rgb}\n"
+                f"\tInner angle: {self.inner_angle}\n"
+                f"\tOuter angle: {self.outer_angle}\n"
+                f"\tRotation: {self.angle.angle}\n")
+
 class SoundEmitter(Point):
     """
     Stores data for a sound emitter point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('sound', 'range')
+
     def __init__(self) -> None:
         """
         Creates a SoundEmitter instance.
@@ -1587,11 +2788,27 @@ class SoundEmitter(Point):
         # Write range
         write_float(file, self.range, 'sound emitter range')
 
+    def info(self) -> str:
+        """
+        Formats the sound emitter data in a human-readable format.
+
+        Returns:
+            str: The formatted sound emitter data.
+        """
+
+        # Return sound emitter info
+        return (f"\tPosition: {self.pos}\n"
+                f"\tRange: {self.range}\n"
+                f"\tSound ID: {self.sound}\n")
+
 class PlayerStart(Point):
     """
     Stores data for a player start point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('angle',)
+
     def __init__(self) -> None:
         """
         Creates a PlayerStart instance.
@@ -1644,11 +2861,25 @@ class PlayerStart(Point):
         # Write angle
         self.angle.write_as_string(file)
 
+    def info(self) -> str:
+        """
+        Formats the player start data in a human-readable format. Player starts have no data shown.
+
+        Returns:
+            str: The formatted player start data.
+        """
+
+        # Return empty info
+        return ''
+
 class Model(Point):
     """
     Stores data for a model point in a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('path', 'angle', 'scale')
+
     def __init__(self) -> None:
         """
         Creates a Model instance.
@@ -1715,11 +2946,39 @@ class Model(Point):
         # Write scale
         self.scale.write(file)
 
+    def info(self) -> str:
+        """
+        Formats the model data in a human-readable format.
+
+        Returns:
+            str: The formatted model data.
+        """
+
+        # Return model info
+        return (f"\tPosition: {self.pos}\n"
+                f"\tModel: {self.path}\n"
+                f"\tRotation: {self.angle.angle}\n"
+                f"\tScale: {self.scale.scale}\n")
+
+# Define point classes by classname
+_POINT_CLASSES: dict[str, type[Point]] = {
+    'screen': Screen,
+    'waypoint': Waypoint,
+    'light': Light,
+    'spotlight': Spotlight,
+    'soundemitter': SoundEmitter,
+    'playerstart': PlayerStart,
+    'model': Model
+}
+
 class RoomMesh:
     """
     Stores data for a RoomMesh file.
     """
 
+    # Define attribute slots
+    __slots__: tuple[str, ...] = ('signature', 'objects', 'collisions', 'triggers', 'points')
+
     def __init__(self) -> None:
         """
         Creates a RoomMesh instance.
@@ -1746,134 +3005,125 @@ class RoomMesh:
             None.
         """
 
-        # Get signature
-        self.signature = read_string(file, "file signature")
+        # Read from memory
+        with _Cursor(file) as cursor:
+            # Get signature
+            self.signature = read_string(cursor, "file signature")
 
-        # Ensure signature matches expected signature
-        if self.signature not in ("RoomMesh", "RoomMesh.HasTriggerBox"):
-            raise ValueError(f"Unexpected signature string: {self.signature}.")
+            # Ensure signature matches expected signature
+            if self.signature not in ("RoomMesh", "RoomMesh.HasTriggerBox"):
+                raise ValueError(f"Unexpected signature string: {self.signature}.")
 
-        # Get object count
-        object_count: int = read_integer(file, "object count")
+            # Get object count
+            object_count: int = read_integer(cursor, "object count")
 
-        # Get objects
-        for _ in range(object_count):
-            # Get object
-            mesh: Object = Object()
-            mesh.parse(file)
-            self.objects.append(mesh)
+            # Get objects
+            self.objects.extend(parse_list(cursor, Object, object_count))
 
-        # Get collision count
-        collision_count: int = read_integer(file, 'collision count')
+            # Get collision count
+            collision_count: int = read_integer(cursor, 'collision count')
+
+            # Get collisions
+            self.collisions.extend(parse_list(cursor, Collision, collision_count))
+
+            # Get trigger boxes
+            if self.signature == 'RoomMesh.HasTriggerBox':
+                # Get trigger count
+                trigger_count: int = read_integer(cursor, 'trigger count')
+
+                # Parse triggers
+                self.triggers.extend(parse_list(cursor, TriggerBox, trigger_count))
+
+            # Get point count
+            point_count: int = read_integer(cursor, "point count")
+
+            # Bind lookups used for every point
+            get_point_class = _POINT_CLASSES.get
+            append_point = self.points.append
+
+            # Get points
+            for _ in range(point_count):
+                # Get classname
+                classname: str = read_string(cursor, "point classname")
+
+                # Get point class
+                point_class: type[Point] | None = get_point_class(classname)
+
+                # Skip unknown point classes
+                if point_class is None:
+                    continue
 
-        # Get collisions
-        for _ in range(collision_count):
-            # Get collision
-            collision: Collision = Collision()
-            collision.parse(file)
-            self.collisions.append(collision)
-
-        # Get trigger boxes
-        if self.signature == 'RoomMesh.HasTriggerBox':
-            # Get trigger count
-            trigger_count: int = read_integer(file, 'trigger count')
-
-            # Parse triggers
-            for _ in range(trigger_count):
-                # Get trigger
-                trigger: TriggerBox = TriggerBox()
-                trigger.parse(file)
-                self.triggers.append(trigger)
-
-        # Get point count
-        point_count: int = read_integer(file, "point count")
-
-        # Get points
-        for _ in range(point_count):
-            # Get classname
-            classname: str = read_string(file, "point classname")
-
-            # Match point class
-            match classname:
                 # Get point
-                case 'screen':
-                    screen: Screen = Screen()
-                    screen.parse(file)
-                    self.points.append(screen)
-                case 'waypoint':
-                    waypoint: Waypoint = Waypoint()
-                    waypoint.parse(file)
-                    self.points.append(waypoint)
-                case 'light':
-                    light: Light = Light()
-                    light.parse(file)
-                    self.points.append(light)
-                case 'spotlight':
-                    spotlight: Spotlight = Spotlight()
-                    spotlight.parse(file)
-                    self.points.append(spotlight)
-                case 'soundemitter':
-                    sound_emitter: SoundEmitter = SoundEmitter()
-                    sound_emitter.parse(file)
-                    self.points.append(sound_emitter)
-                case 'playerstart':
-                    player_start: PlayerStart = PlayerStart()
-                    player_start.parse(file)
-                    self.points.append(player_start)
-                case 'model':
-                    model: Model = Model()
-                    model.parse(file)
-                    self.points.append(model)
+                point: Point = point_class()
+                point.parse(cursor)
+                append_point(point)
 
-    def write(self, file: BinaryIO) -> None:
+    def to_bytes(self) -> bytes:
         """
-        Writes the data for a RoomMesh file.
-
-        Args:
-            file (BinaryIO): The RoomMesh file opened in binary write mode.
+        Serializes the data for a RoomMesh file in memory.
 
         Returns:
-            None.
+            bytes: The RoomMesh file data.
         """
 
+        # Create in-memory buffer
+        buffer: BytesIO = BytesIO()
+
         # Write signature
-        write_string(file, self.signature, "file signature")
+        write_string(buffer, self.signature, "file signature")
 
         # Write object count
-        write_integer(file, len(self.objects), "object count")
+        write_integer(buffer, len(self.objects), "object count")
 
         # Write objects
         for mesh in self.objects:
             # Write object
-            mesh.write(file)
+            mesh.write(buffer)
 
         # Write collision count
-        write_integer(file, len(self.collisions), "collision count")
+        write_integer(buffer, len(self.collisions), "collision count")
 
         # Write collisions
         for collision in self.collisions:
-            collision.write(file)
+            collision.write(buffer)
 
         # Write trigger boxes
         if len(self.triggers) > 0:
             # Write trigger count
-            write_integer(file, len(self.triggers), "trigger count")
+            write_integer(buffer, len(self.triggers), "trigger count")
 
             # Write triggers
             for trigger in self.triggers:
                 # Write trigger
-                trigger.write(file)
+                trigger.write(buffer)
 
         # Write point count
-        write_integer(file, len(self.points), "point count")
+        write_integer(buffer, len(self.points), "point count")
 
         # Write points
         for point in self.points:
             # Write point
-            point.write(file)
+            point.write(buffer)
 
         # Write EOF
-        write_string(file, "EOF", "end of file")
+        write_string(buffer, "EOF", "end of file")
+
+        # Return file data
+        return buffer.getvalue()
+
+    def write(self, file: BinaryIO) -> None:
+        """
+        Writes the data for a RoomMesh file in a single call.
+
+        Args:
+            file (BinaryIO): The RoomMesh file opened in binary write mode.
+
+        Returns:
+            None.
+        """
+
+        # Write file data
+        write_block(file, self.to_bytes(), "RoomMesh data")
 
     def write_info(self, file: TextIO) -> None:
         """
@@ -1886,163 +3136,95 @@ class RoomMesh:
             None.
         """
 
+        # Collect lines to write in a single call
+        lines: list[str] = []
+
+        # Share formatting between identical collisions
+        collision_info: dict[tuple, str] = {}
+
         # Write file signature
-        file.write(f"File signature: {self.signature}\n")
-        file.write("\n")
+        lines.append(f"File signature: {self.signature}\n")
+        lines.append("\n")
 
         # Write object count
-        file.write(f"Object count: {len(self.objects)}\n")
+        lines.append(f"Object count: {len(self.objects)}\n")
 
         # Write object info
         for obj_index, obj in enumerate(self.objects):
             # Write object index
-            file.write(f"Object {obj_index}:\n")
+            lines.append(f"Object {obj_index}:\n")
 
             # Write texture info
             for tex_index, texture in enumerate(obj.textures):
                 # Write texture info
-                file.write(f"\tTexture ID: {texture.layer_ID}\n")
-                file.write(f"\tTexture name: {texture.filename}\n")
-            file.write("\n")
+                lines.append(f"\tTexture ID: {texture.layer_ID}\n")
+                lines.append(f"\tTexture name: {texture.filename}\n")
+            lines.append("\n")
 
             # Write vertex count
-            file.write(f"\tVertex count: {len(obj.vertices)}\n")
+            lines.append(f"\tVertex count: {obj.vertex_count}\n")
 
             # Write vertex info
-            for vert_index, vertex in enumerate(obj.vertices):
-                # Write vertex index
-                file.write(f"\tVertex {vert_index}:\n")
-
-                # Write vertex data
-                file.write(f"\t\tPos: {vertex.pos.pos}\n")
-                file.write(f"\t\tDiffuse UV: {vertex.uv_1.pos}\n")
-                file.write(f"\t\tLightmap UV: {vertex.uv_2.pos}\n")
-                file.write(f"\t\tColor: {vertex.color.rgb}\n")
-            file.write("\n")
+            lines.extend(f"\tVertex {vert_index}:\n"
+                         f"\t\tPos: {pos}\n"
+                         f"\t\tDiffuse UV: {uv_1}\n"
+                         f"\t\tLightmap UV: {uv_2}\n"
+                         f"\t\tColor: {color}\n"
+                         for vert_index, (pos, uv_1, uv_2, color) in enumerate(zip(group(obj.positions, 3),
+                                                                                   group(obj.uvs_1, 2),
+                                                                                   group(obj.uvs_2, 2),
+                                                                                   group(obj.colors, 3))))
+            lines.append("\n")
 
             # Write triangle count
-            file.write(f"\tTriangle count: {len(obj.triangles)}\n")
+            lines.append(f"\tTriangle count: {obj.triangle_count}\n")
 
             # Write triangle info
-            for tri_index, triangle in enumerate(obj.triangles):
-                # Write triangle index
-                file.write(f"\tTriangle {tri_index}:\n")
-
-                # Write triangle data
-                file.write(f"\t\tVertex indices: {triangle.indices}\n")
-            file.write("\n")
+            lines.extend(f"\tTriangle {tri_index}:\n"
+                         f"\t\tVertex indices: {indices}\n"
+                         for tri_index, indices in enumerate(group(obj.indices, 3)))
+            lines.append("\n")
 
         # Write collision count
-        file.write(f"Collision count: {len(self.collisions)}:\n")
+        lines.append(f"Collision count: {len(self.collisions)}:\n")
 
         # Write collision info
         for col_index, collision in enumerate(self.collisions):
             # Write collision index
-            file.write(f"Collision {col_index}:\n")
+            lines.append(f"Collision {col_index}:\n")
 
-            # Write vertex count
-            file.write(f"\tVertex count: {len(collision.vertices)}\n")
-
-            # Write vertex info
-            for vert_index, vertex in enumerate(collision.vertices):
-                # Write vertex index
-                file.write(f"\tVertex {vert_index}:\n")
-
-                # Write vertex data
-                file.write(f"\t\tPosition: {vertex.pos}\n")
-            file.write("\n")
-
-            # Write triangle count
-            file.write(f"\tTriangle count: {len(collision.triangles)}\n")
-
-            # Write triangle info
-            for tri_index, triangle in enumerate(collision.triangles):
-                # Write triangle index
-                file.write(f"\tTriangle {tri_index}\n")
-
-                # Write triangle data
-                file.write(f"\t\tVertex indices: {triangle.indices}\n")
-            file.write("\n")
+            # Write collision data
+            lines.append(collision.info('\t', collision_info))
 
         # Write trigger count
-        file.write(f"Trigger count: {len(self.triggers)}\n")
+        lines.append(f"Trigger count: {len(self.triggers)}\n")
 
         # Write trigger info
         for trig_index, trigger in enumerate(self.triggers):
             # Write trigger name and index
-            file.write(f"Trigger {trig_index} - {trigger.name}:\n")
+            lines.append(f"Trigger {trig_index} - {trigger.name}:\n")
 
             # Write collision info
             for col_index, collision in enumerate(trigger.collisions):
                 # Write collision index
-                file.write(f"\tCollision {col_index}:\n")
+                lines.append(f"\tCollision {col_index}:\n")
 
-                # Write vertex count
-                file.write(f"\t\tVertex count: {len(collision.vertices)}\n")
-
-                # Write vertex info
-                for vert_index, vertex in enumerate(collision.vertices):
-                    # Write vertex index
-                    file.write(f"\t\tVertex {vert_index}:\n")
-
-                    # Write vertex data
-                    file.write(f"\t\t\tPosition: {vertex.pos}\n")
-                file.write("\n")
-
-                # Write triangle count
-                file.write(f"\t\tTriangle count: {len(collision.triangles)}\n")
-
-                # Write triangle info
-                for tri_index, triangle in enumerate(collision.triangles):
-                    # Write triangle index
-                    file.write(f"\t\tTriangle {tri_index}\n")
-
-                    # Write triangle data
-                    file.write(f"\t\t\tVertex indices: {triangle.indices}\n")
-                file.write("\n")
+                # Write collision data
+                lines.append(collision.info('\t\t', collision_info))
 
         # Write point count
-        file.write(f"Point count: {len(self.points)}\n")
+        lines.append(f"Point count: {len(self.points)}\n")
 
         # Write point info
         for point_index, point in enumerate(self.points):
             # Write point type and index
-            file.write(f"Point {point_index} - {point.classname}:\n")
+            lines.append(f"Point {point_index} - {point.classname}:\n")
 
             # Write point info
-            if isinstance(point, Screen):
-                # Write screen data
-                file.write(f"\tPosition: {point.pos}\n")
-                file.write(f"\tImage: {point.path}\n")
-            if isinstance(point, Waypoint):
-                # Write waypoint data
-                file.write(f"\tPosition: {point.pos}\n")
-            if isinstance(point, Light):
-                # Write light data
-                file.write(f"\tPosition: {point.pos}\n")
-                file.write(f"\tIntensity: {point.intensity}\n")
-                file.write(f"\tRange: {point.range}\n")
-                file.write(f"\tColor: {point.color.rgb}\n")
-            if isinstance(point, Spotlight):
-                # Write spotlight data
-                file.write(f"\tPosition: {point.pos}\n")
-                file.write(f"\tIntensity: {point.intensity}\n")
-                file.write(f"\tRange: {point.range}\n")
-                file.write(f"\tColor: {point.color.rgb}\n")
-                file.write(f"\tInner angle: {point.inner_angle}\n")
-                file.write(f"\tOuter angle: {point.outer_angle}\n")
-                file.write(f"\tRotation: {point.angle.angle}\n")
-            if isinstance(point, SoundEmitter):
-                # Write sound emitter data
-                file.write(f"\tPosition: {point.pos}\n")
-                file.write(f"\tRange: {point.range}\n")
-                file.write(f"\tSound ID: {point.sound}\n")
-            if isinstance(point, Model):
-                # Write model data
-                file.write(f"\tPosition: {point.pos}\n")
-                file.write(f"\tModel: {point.path}\n")
-                file.write(f"\tRotation: {point.angle.angle}\n")
-                file.write(f"\tScale: {point.scale.scale}\n")
+            lines.append(point.info())
+
+        # Write collected lines
+        file.write(''.join(lines))
 
 # Testing
 def main(filename: str) -> int:
@@ -2062,7 +3244,15 @@ def main(filename: str) -> int:
 
         # Attempt to parse file data and reconstruct it
         with open(filename, 'rb') as file:
-            room.parse(file)
+            # Attempt to map file into memory
+            try:
+                data: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Parse empty files directly, as they can't be mapped and the parser reports the missing data
+                room.parse(file)
+            else:
+                with data:
+                    room.parse(data)
         with open('info.txt', 'w') as file:
             room.write_info(file)
 
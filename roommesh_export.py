@@ -1,44 +1,197 @@
 # Import modules
+from array import array
+from collections.abc import Callable
 from pathlib import Path
 import bpy
 from bpy.props import StringProperty
-from bpy.types import (Context, FloatColorAttribute, Image, Material, Menu, Mesh, MeshPolygon, MeshVertex,
+from bpy.types import (Context, FloatColorAttribute, Image, Material, Menu, Mesh, MeshPolygon,
                        Node,NodeSocket, Object as BObject, Operator, MeshUVLoopLayer)
 from bpy_extras.io_utils import ExportHelper
-from mathutils import Vector
+import numpy as np
 from . import roommesh
 from .roommesh_import import report
 
-def transform_pos(obj: bpy.types.Object,
-                  local: tuple[float, float, float] | None = None) -> tuple[float, float, float]:
+def transform_origin(obj: bpy.types.Object) -> tuple[float, float, float]:
     """
-    Applies the necessary transforms for converting Blender meshes to RoomMesh ones.
+    Applies the necessary transforms for converting a Blender object origin to a RoomMesh position.
 
     Args:
         obj (Object): The Blender object to apply transforms to.
-        local (tuple[float, float, float] | None): The origin of the object. If none is provided, world origin is
-        used.
 
     Returns:
-        Vector: The resulting position.
+        tuple[float, float, float]: The resulting position.
     """
 
     # Get world position
-    if local is None:
-        world_position = obj.matrix_world.translation
-    else:
-        world_position = obj.matrix_world @ Vector(local)
+    x, y, z = obj.matrix_world.translation
 
     # Return scaled world position
-    return world_position * 160.0
+    return x * 160.0, y * 160.0, z * 160.0
+
+def transform_positions(obj: bpy.types.Object,
+                        coords: np.ndarray) -> np.ndarray:
+    """
+    Applies the world transform and RoomMesh scale to many local positions at once.
+
+    Args:
+        obj (Object): The Blender object to apply transforms to.
+        coords (ndarray): The local positions, shaped (vertex count, 3).
+
+    Returns:
+        ndarray: The resulting positions, shaped (vertex count, 3).
+    """
+
+    # Get world matrix
+    matrix: np.ndarray = np.array(obj.matrix_world, dtype=np.float64)
+
+    # Apply rotation, scale and translation
+    world_positions: np.ndarray = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+    # Return scaled world positions
+    return (world_positions * 160.0).astype(np.float32)
+
+def get_coordinates(mesh: Mesh) -> np.ndarray:
+    """
+    Reads the local coordinates of every vertex in a mesh with a single bulk copy.
+
+    Args:
+        mesh (Mesh): The mesh to read from.
+
+    Returns:
+        ndarray: The vertex coordinates, shaped (vertex count, 3).
+    """
+
+    # Allocate coordinate buffer
+    coords: np.ndarray = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+
+    # Copy coordinates
+    mesh.vertices.foreach_get("co", coords)
+
+    # Return coordinates
+    return coords.reshape(-1, 3)
+
+def get_triangles(mesh: Mesh) -> np.ndarray:
+    """
+    Reads the vertex indices of every loop triangle in a mesh with a single bulk copy.
+
+    Args:
+        mesh (Mesh): The mesh to read from.
+
+    Returns:
+        ndarray: The flat triangle vertex indices.
+    """
+
+    # Ensure triangles are updated
+    if not mesh.loop_triangles:
+        mesh.calc_loop_triangles()
+
+    # Allocate index buffer
+    indices: np.ndarray = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+
+    # Copy indices
+    mesh.loop_triangles.foreach_get("vertices", indices)
+
+    # Return indices
+    return indices
+
+def get_first_loops(mesh: Mesh) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the first loop that uses each vertex of a mesh, in polygon order.
+
+    Args:
+        mesh (Mesh): The mesh to read from.
+
+    Returns:
+        tuple[ndarray, ndarray]: The indices of vertices used by at least one loop, and the first loop of each.
+    """
+
+    # Copy loop vertex indices
+    loop_vertices: np.ndarray = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+    # Return first loop of each vertex
+    return np.unique(loop_vertices, return_index=True)
+
+def get_first_uvs(mesh: Mesh,
+                  uv_layer: MeshUVLoopLayer | None) -> np.ndarray:
+    """
+    Gets one UV per vertex from a UV layer, taken from the first loop that uses each vertex. RoomMesh stores UVs
+    per vertex, while Blender stores them per loop. V is flipped to match RoomMesh.
+
+    Args:
+        mesh (Mesh): The mesh to read from.
+        uv_layer (MeshUVLoopLayer | None): The UV layer to read. Vertices get (0, 0) if none is provided.
+
+    Returns:
+        ndarray: The vertex UVs, shaped (vertex count, 2).
+    """
+
+    # Create empty UVs
+    first_uv: np.ndarray = np.zeros((len(mesh.vertices), 2), dtype=np.float32)
+
+    # Ensure UV layer exists
+    if uv_layer is None:
+        return first_uv
+
+    # Copy loop UVs
+    loop_uvs: np.ndarray = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", loop_uvs)
+    loop_uvs = loop_uvs.reshape(-1, 2)
+
+    # Find the first loop of each vertex
+    vertex_indices, first_loops = get_first_loops(mesh)
+
+    # Store first UVs with V flipped
+    first_uv[vertex_indices, 0] = loop_uvs[first_loops, 0]
+    first_uv[vertex_indices, 1] = 1.0 - loop_uvs[first_loops, 1]
+
+    # Return UVs
+    return first_uv
+
+def get_colors(mesh: Mesh) -> np.ndarray:
+    """
+    Gets one RoomMesh color per vertex from the active color attribute. Corner colors are taken from the first loop
+    that uses each vertex. Vertices default to white if the mesh has no color attribute.
+
+    Args:
+        mesh (Mesh): The mesh to read from.
+
+    Returns:
+        ndarray: The vertex colors as bytes, shaped (vertex count, 3).
+    """
+
+    # Get color attribute
+    vertex_colors: FloatColorAttribute | None = mesh.color_attributes.active_color
+
+    # Default to white
+    if vertex_colors is None:
+        return np.full((len(mesh.vertices), 3), 255, dtype=np.uint8)
+
+    # Copy colors
+    colors: np.ndarray = np.empty(len(vertex_colors.data) * 4, dtype=np.float32)
+    vertex_colors.data.foreach_get("color", colors)
+    colors = colors.reshape(-1, 4)[:, :3]
+
+    # Convert corner colors to vertex colors
+    if vertex_colors.domain == 'CORNER':
+        # Get first loop colors
+        corner_colors: np.ndarray = colors
+        colors = np.ones((len(mesh.vertices), 3), dtype=np.float32)
+        vertex_indices, first_loops = get_first_loops(mesh)
+        colors[vertex_indices] = corner_colors[first_loops]
+
+    # Return colors as bytes
+    return np.clip(colors.astype(np.float64) * 255, 0, 255).astype(np.uint8)
 
 # Define material functions
-def get_diffuse(obj: bpy.types.Object) -> bpy.types.Image | None:
+def get_diffuse(obj: bpy.types.Object,
+                diffuse_cache: dict[Material, Image] | None = None) -> bpy.types.Image | None:
     """
     Gets the diffuse map off an object, if one exists.
 
     Args:
         obj (Object): The object to use.
+        diffuse_cache (dict[Material, Image] | None): Diffuse maps already found for shared materials.
 
     Returns:
         Image | None: The diffuse map, if one exists.
@@ -55,6 +208,11 @@ def get_diffuse(obj: bpy.types.Object) -> bpy.types.Image | None:
     # Retrieve material
     material: Material | None = obj.active_material or next((m for m in obj.data.materials if m), None)
 
+    # Check if material was already searched
+    if diffuse_cache is not None and material in diffuse_cache:
+        # Return cached image
+        return diffuse_cache[material]
+
     # Ensure material has node data
     if not material.use_nodes:
         # Write warning
@@ -91,13 +249,15 @@ def get_diffuse(obj: bpy.types.Object) -> bpy.types.Image | None:
     if diffuse_link and diffuse_link.is_linked:
         # Get diffuse node
         diffuse_node: Node = diffuse_link.links[0].from_node
-        print("Dif link")
 
         # Ensure node is an image
         if diffuse_node.type == "TEX_IMAGE":
             # Get image
             image: Image = diffuse_node.image
-            print("node image")
+
+            # Cache image for objects sharing this material
+            if diffuse_cache is not None:
+                diffuse_cache[material] = image
 
             # Return image
             return image
@@ -159,66 +319,16 @@ def normalize_color(r: float,
     # Return color
     return int(r * 255), int(g * 255), int(b * 255)
 
-def convert_vertex(mesh: Mesh,
-                   poly_index: int,
-                   vertex_index: int,
-                   vertex: MeshVertex) -> roommesh.Vertex:
-    """
-    Converts a Blender Vertex into a RoomMesh Vertex.
-
-    Args:
-        mesh (Mesh): The Mesh the vertex is attached to.
-        poly_index (int): The index of the polygon containing the vertex.
-        vertex_index (int): The index of the vertex being converted.
-        vertex (MeshVertex): The Vertex to convert.
-
-    Returns:
-        room Vertex: The created Vertex.
-    """
-
-    # Create empty Vertex
-    room_vertex: roommesh.Vertex = roommesh.Vertex()
-
-    # Set Vertex position
-    room_vertex.set_pos(*tuple(vertex.co))
-
-    # Create UV data
-    uv_layer: bpy.types.MeshUVLoopLayer | None = mesh.uv_layers.active
-
-    # Loop through mesh loops
-    if uv_layer is not None:
-        for loop_index in mesh.polygons[poly_index].loop_indices:
-            # Check if vertex is found
-            if mesh.loops[loop_index].vertex_index == vertex_index:
-                # Set vertex UVs
-                room_vertex.set_uv_1(*tuple(uv_layer.data[loop_index].uv))
-                break
-
-    # Set color data
-    vertex_colors: FloatColorAttribute = mesh.color_attributes.active_color
-
-    # Check if vertex colors exist
-    if vertex_colors is None:
-        # Default to white
-        room_vertex.set_color(255, 255, 255)
-
-        # Return vertex
-        return room_vertex
-
-    # Get Vertex color
-    color: tuple[float, float, float, float] = vertex_colors.data[vertex_index].color
-    room_vertex.set_color(*normalize_color(color[0], color[1], color[2]))
-
-    # Return Vertex
-    return room_vertex
-
-def convert_object(obj: bpy.types.Object, filepath: Path) -> roommesh.Object:
+def convert_object(obj: bpy.types.Object,
+                   filepath: Path,
+                   diffuse_cache: dict[Material, Image] | None = None) -> roommesh.Object:
     """
     Converts a Blender Object into a RoomMesh Object, complete with texture and mesh data.
 
     Args:
         obj (blend Object): The Blender Object to convert.
         filepath (Path): Place that the roommesh is saved, for texture saving.
+        diffuse_cache (dict[Material, Image] | None): Diffuse maps already found for shared materials.
 
     Returns:
         room Object: The created RoomMesh Object.
@@ -228,54 +338,32 @@ def convert_object(obj: bpy.types.Object, filepath: Path) -> roommesh.Object:
     room_obj: roommesh.Object = roommesh.Object()
 
     # Get textures
-    diffuse_image: bpy.types.Image | None = get_diffuse(obj)
+    diffuse_image: bpy.types.Image | None = get_diffuse(obj, diffuse_cache)
     if diffuse_image:
         diffuse: roommesh.Texture = convert_texture(diffuse_image, 1)
 
         # Assign textures
         room_obj.textures.append(diffuse)
 
-    # Ensure triangles are updated
-    if not obj.data.loop_triangles:
-        obj.data.calc_loop_triangles()
+    # Get mesh
+    mesh: Mesh = obj.data
 
     # Get UV data
-    uv_layer = obj.data.uv_layers.active
-    first_uv: dict = {}
-
-    if uv_layer is not None:
-        for poly in obj.data.polygons:
-            for loop_index in poly.loop_indices:
-                vi = obj.data.loops[loop_index].vertex_index
-                if vi not in first_uv:
-                    u, v = uv_layer.data[loop_index].uv
-                    first_uv[vi] = (u, 1.0 - v)
-
-    # Get vertices
-    positions = [transform_pos(obj, vertex.co) for vertex in obj.data.vertices]
-    triangles = [tuple(tri.vertices) for tri in obj.data.loop_triangles]
-
-    # Assign vertices
-    for vi, v in enumerate(obj.data.vertices):
-        # Create vertex
-        vertex = roommesh.Vertex()
-        vertex.set_pos(*transform_pos(obj, tuple(v.co)))
-
-        if vi in first_uv:
-            u, v = first_uv[vi]
-            vertex.set_uv_1(u, v)
-
-        # Append vertex
-        room_obj.vertices.append(vertex)
-
-    # Assign faces
-    for tri in obj.data.loop_triangles:
-        # Create triangle
-        triangle = roommesh.Triangle()
-        triangle.set_indices(*tri.vertices)
-
-        # Append triangle
-        room_obj.triangles.append(triangle)
+    uv_layer: MeshUVLoopLayer | None = mesh.uv_layers.active
+    first_uv: np.ndarray = get_first_uvs(mesh, uv_layer)
+
+    # Transform vertex coordinates in bulk
+    world_positions: np.ndarray = transform_positions(obj, get_coordinates(mesh))
+
+    # Store vertex data, leaving lightmap UVs empty
+    vertex_count: int = len(world_positions)
+    room_obj.positions = array('f', world_positions.tobytes())
+    room_obj.uvs_1 = array('f', first_uv.tobytes())
+    room_obj.uvs_2 = array('f', bytes(vertex_count * 8))
+    room_obj.colors = array('B', get_colors(mesh).tobytes())
+
+    # Store faces
+    room_obj.indices = array('I', get_triangles(mesh).tobytes())
 
     # Return RoomMesh Object
     return room_obj
@@ -294,39 +382,29 @@ def convert_collision(obj: BObject) -> roommesh.Collision:
     # Create new Object
     collision: roommesh.Collision = roommesh.Collision()
 
-    # Get vertices
-    positions = [transform_pos(obj, vertex.co) for vertex in obj.data.vertices]
-    triangles = [tuple(tri.vertices) for tri in obj.data.loop_triangles]
-
-    # Assign vertices
-    for index, position in enumerate(positions):
-        # Create vertex
-        vertex = roommesh.Vertex()
-        vertex.set_pos(*positions[index])
+    # Get mesh
+    mesh: Mesh = obj.data
 
-        # Append vertex
-        collision.vertices.append(vertex.pos)
+    # Store transformed vertex positions in bulk
+    collision.positions = array('f', transform_positions(obj, get_coordinates(mesh)).tobytes())
 
-    # Assign triangles
-    for face in triangles:
-        # Create triangle
-        triangle = roommesh.Triangle()
-        triangle.set_indices(*face)
-
-        # Append triangle
-        collision.triangles.append(triangle)
+    # Store triangles
+    collision.indices = array('I', get_triangles(mesh).tobytes())
 
     # Return RoomMesh Object
     return collision
 
 def convert_trigger_box(room: roommesh.RoomMesh,
-                        obj: bpy.types.Object) -> None:
+                        obj: bpy.types.Object,
+                        triggers_by_name: dict[str, roommesh.TriggerBox] | None = None) -> None:
     """
     Converts a Blender Object into a RoomMesh Trigger Box. Added to the room automatically.
 
     Args:
         room (RoomMesh): The full RoomMesh, checking for existing trigger collection.
         obj (blend Object): The Blender Object to convert.
+        triggers_by_name (dict[str, TriggerBox] | None): The room's triggers keyed by name. Built from the room if
+        none is provided.
 
     Returns:
         None.
@@ -335,25 +413,32 @@ def convert_trigger_box(room: roommesh.RoomMesh,
     # Get collision object
     collision: roommesh.Collision = convert_collision(obj)
 
-    # Loop through triggers
-    for trigger in room.triggers:
-        # Look for existing trigger
-        if obj.roommesh.trigger_name == trigger.name:
-            # Append to existing trigger
-            trigger.collisions.append(collision)
+    # Get trigger name
+    trigger_name: str = obj.roommesh.trigger_name
+
+    # Index existing triggers by name
+    if triggers_by_name is None:
+        triggers_by_name = {trigger.name: trigger for trigger in reversed(room.triggers)}
 
-            # Return
-            return
+    # Look for existing trigger
+    existing: roommesh.TriggerBox | None = triggers_by_name.get(trigger_name)
+    if existing is not None:
+        # Append to existing trigger
+        existing.collisions.append(collision)
+
+        # Return
+        return
 
     # Create new trigger
     trigger: roommesh.TriggerBox = roommesh.TriggerBox()
 
     # Set trigger properties
-    trigger.name = obj.roommesh.trigger_name
+    trigger.name = trigger_name
     trigger.collisions.append(collision)
 
     # Add trigger to room
     room.triggers.append(trigger)
+    triggers_by_name[trigger_name] = trigger
 
 def convert_screen(obj: bpy.types.Object) -> roommesh.Screen:
     """
@@ -372,7 +457,7 @@ def convert_screen(obj: bpy.types.Object) -> roommesh.Screen:
 
 
     # Get screen data
-    screen.pos.set_pos(*transform_pos(obj))
+    screen.pos.set_pos(*transform_origin(obj))
 
     # Ensure screen type is image
     if getattr(obj, "empty_display_type", "") != "IMAGE":
@@ -398,7 +483,7 @@ def convert_waypoint(obj: bpy.types.Object) -> roommesh.Waypoint:
     waypoint: roommesh.Waypoint = roommesh.Waypoint()
 
     # Get waypoint data
-    waypoint.pos.set_pos(*transform_pos(obj))
+    waypoint.pos.set_pos(*transform_origin(obj))
 
     # Return waypoint
     return waypoint
@@ -418,13 +503,14 @@ def convert_light(obj: bpy.types.Object) -> roommesh.Light:
     light: roommesh.Light = roommesh.Light()
 
     # Get light data
-    light.pos.set_pos(*transform_pos(obj))
-    if obj.data.use_custom_distance:
-        light.range = obj.data.cutoff_distance
+    light_data: bpy.types.PointLight = obj.data
+    light.pos.set_pos(*transform_origin(obj))
+    if light_data.use_custom_distance:
+        light.range = light_data.cutoff_distance
     else:
         light.range = 40.0
-    light.color.set_rgb(*normalize_color(obj.data.color[0], obj.data.color[1], obj.data.color[2]))
-    light.intensity = obj.data.energy / 50
+    light.color.set_rgb(*normalize_color(*light_data.color))
+    light.intensity = light_data.energy / 50
 
     # Return light
     return light
@@ -444,15 +530,16 @@ def convert_spotlight(obj: bpy.types.Object) -> roommesh.Spotlight:
     spotlight: roommesh.Spotlight = roommesh.Spotlight()
 
     # Get light data
-    spotlight.pos.set_pos(*transform_pos(obj))
-    if obj.data.use_custom_distance:
-        spotlight.range = obj.data.cutoff_distance
-    spotlight.color.set_rgb(*normalize_color(obj.data.color[0], obj.data.color[1], obj.data.color[2]))
-    spotlight.intensity = obj.data.energy / 50
+    light_data: bpy.types.SpotLight = obj.data
+    spotlight.pos.set_pos(*transform_origin(obj))
+    if light_data.use_custom_distance:
+        spotlight.range = light_data.cutoff_distance
+    spotlight.color.set_rgb(*normalize_color(*light_data.color))
+    spotlight.intensity = light_data.energy / 50
 
     # Get spotlight data
-    spotlight.outer_angle = obj.data.spot_size
-    spotlight.inner_angle = obj.data.spot_blend * (spotlight.outer_angle if spotlight.outer_angle > 0.0 else 1.0)
+    spotlight.outer_angle = light_data.spot_size
+    spotlight.inner_angle = light_data.spot_blend * (spotlight.outer_angle if spotlight.outer_angle > 0.0 else 1.0)
 
     # Return spotlight
     return spotlight
@@ -472,7 +559,7 @@ def convert_soundemitter(obj: bpy.types.Object) -> roommesh.SoundEmitter:
     sound_emitter: roommesh.SoundEmitter = roommesh.SoundEmitter()
 
     # Get sound emitter data
-    sound_emitter.pos.set_pos(*transform_pos(obj))
+    sound_emitter.pos.set_pos(*transform_origin(obj))
     sound_emitter.sound = obj.roommesh.sound_ID
     sound_emitter.range = obj.data.distance_max
 
@@ -494,11 +581,18 @@ def convert_playerstart(obj: bpy.types.Object) -> roommesh.PlayerStart:
     player_start: roommesh.PlayerStart = roommesh.PlayerStart()
 
     # Get player start data
-    player_start.pos.set_pos(*transform_pos(obj))
+    player_start.pos.set_pos(*transform_origin(obj))
 
     # Return player start
     return player_start
 
+# Define point converters for empty roles
+_EMPTY_CONVERTERS: dict[str, Callable[[BObject], roommesh.Point]] = {
+    'SCREEN': convert_screen,
+    'WAYPOINT': convert_waypoint,
+    'PLAYERSTART': convert_playerstart
+}
+
 # Define export functions
 def export_roommesh(context: Context,
                     filepath: Path) -> set[str]:
@@ -516,88 +610,66 @@ def export_roommesh(context: Context,
     # Create new RoomMesh
     room: roommesh.RoomMesh = roommesh.RoomMesh()
 
-    # Loop through scene objects
+    # Create diffuse map cache for shared materials
+    diffuse_cache: dict[Material, Image] = {}
+
+    # Create object buckets
+    meshes: list[BObject] = []
+    collisions: list[BObject] = []
+    triggers: list[BObject] = []
+    points: list[tuple[Callable[[BObject], roommesh.Point], BObject]] = []
+
+    # Classify scene objects in a single pass
     for obj in context.scene.objects:
         # Match object type
         match obj.type:
             # Handle mesh objects
             case 'MESH':
+                # Get RoomMesh properties
+                properties = obj.roommesh
+
                 # Check if it is collision
-                if obj.roommesh.is_collision:
+                if properties.is_collision:
                     # Check if it is a trigger
-                    if obj.roommesh.is_trigger:
+                    if properties.is_trigger:
                         # Add trigger
-                        convert_trigger_box(room, obj)
-
-                        # Continue loop
-                        continue
-
-                    # Generate collision
-                    collision: roommesh.Collision = convert_collision(obj)
-
-                    # Append collision
-                    room.collisions.append(collision)
-
-                    # Continue loop
-                    continue
-
-                # Generate object
-                room_object: roommesh.Object = convert_object(obj, filepath)
-
-                # Append object
-                room.objects.append(room_object)
-
-                # Continue loop
-                continue
+                        triggers.append(obj)
+                    else:
+                        # Add collision
+                        collisions.append(obj)
+                else:
+                    # Add object
+                    meshes.append(obj)
             # Handle empty objects
             case 'EMPTY':
-                # Match point name
-                match obj.roommesh.role:
-                    # Handle screens
-                    case 'SCREEN':
-                        # Build screen
-                        screen: roommesh.Screen = convert_screen(obj)
-
-                        # Append screen
-                        room.points.append(screen)
-
-                    # Handle waypoints
-                    case 'WAYPOINT':
-                        # Build waypoint
-                        waypoint: roommesh.Waypoint = convert_waypoint(obj)
-
-                        # Append waypoint
-                        room.points.append(waypoint)
-
-                    # Handle player starts
-                    case 'PLAYERSTART':
-                        # Build player start
-                        player_start: roommesh.PlayerStart = convert_playerstart(obj)
-
-                        # Append player start
-                        room.points.append(player_start)
+                # Get point converter
+                converter: Callable[[BObject], roommesh.Point] | None = _EMPTY_CONVERTERS.get(obj.roommesh.role)
+
+                # Add point if the empty has a point role
+                if converter:
+                    points.append((converter, obj))
             # Handle lights
             case 'LIGHT':
-                # Get light type
-                if obj.data.type == 'SPOT':
-                    # Build spotlight
-                    spotlight: roommesh.Spotlight = convert_spotlight(obj)
-
-                    # Append spotlight
-                    room.points.append(spotlight)
-                else:
-                    # Build point light
-                    light: roommesh.Light = convert_light(obj)
-
-                    # Append point light
-                    room.points.append(light)
+                # Add spotlight or point light
+                points.append((convert_spotlight if obj.data.type == 'SPOT' else convert_light, obj))
             # Handle speakers
             case 'SPEAKER':
-                # Build sound emitter
-                sound_emitter: roommesh.SoundEmitter = convert_soundemitter(obj)
+                # Add sound emitter
+                points.append((convert_soundemitter, obj))
+
+    # Generate objects
+    room.objects = [convert_object(obj, filepath, diffuse_cache) for obj in meshes]
 
-                # Append sound emitter
-                room.points.append(sound_emitter)
+    # Generate collisions
+    room.collisions = [convert_collision(obj) for obj in collisions]
+
+    # Add triggers, grouping them by name
+    triggers_by_name: dict[str, roommesh.TriggerBox] = {}
+    for obj in triggers:
+        convert_trigger_box(room, obj, triggers_by_name)
+
+    # Generate points in scene order
+    room.points = [converter(obj) for converter, obj in points]
 
     # Check trigger count
     if len(room.triggers) > 0:
@@ -607,10 +679,12 @@ def export_roommesh(context: Context,
         # Write file signature
         room.signature = "RoomMesh"
 
-    # Open RoomMesh file
+    # Write RoomMesh data to memory
+    data: bytes = room.to_bytes()
+
+    # Write RoomMesh file in a single call
     with open(filepath, 'wb') as file:
-        # Write RoomMesh file
-        room.write(file)
+        file.write(data)
 
     # Return successfully
     return {'FINISHED'}
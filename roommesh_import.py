@@ -1,11 +1,23 @@
 # Import modules
 import bpy
+from collections.abc import Callable
+from functools import lru_cache, partial
 import math
 import mathutils
+import mmap
+import os
+import numpy as np
 from pathlib import Path
 
 from . import roommesh
-from .bve import direct_x
+
+# RoomMesh meter -> Blender meter conversion
+ROOMMESH_SCALE: float = 0.00625
+ROOMMESH_SCALE_MATRIX: mathutils.Matrix = mathutils.Matrix.Diagonal(
+    mathutils.Vector((ROOMMESH_SCALE, ROOMMESH_SCALE, ROOMMESH_SCALE, 1.0))).freeze()
+
+# Degree -> radian conversion, matching math.radians
+DEG_TO_RAD: float = math.pi / 180.0
 
 # Define debug functions
 def report(message: str,
@@ -83,11 +95,11 @@ def transform_mesh(obj: bpy.types.Object, is_point: bool = False) -> None:
     """
 
     # Get scale
-    scale: float = 0.00625 # RoomMesh meter -> Blender meter conversion
-    scale_matrix: mathutils.Matrix = mathutils.Matrix.Diagonal(mathutils.Vector((scale, scale, scale, 1.0)))
+    scale: float = ROOMMESH_SCALE
 
     # Update location
-    obj.location = (obj.location[0]*scale, obj.location[1]*scale, obj.location[2]*scale)
+    x, y, z = obj.location
+    obj.location = (x*scale, y*scale, z*scale)
 
     # Check for points
     if is_point or obj.type != "MESH":
@@ -95,7 +107,7 @@ def transform_mesh(obj: bpy.types.Object, is_point: bool = False) -> None:
         return
 
     # Apply scale
-    obj.data.transform(scale_matrix)
+    obj.data.transform(ROOMMESH_SCALE_MATRIX)
 
     # Apply transformations
     obj.data.update()
@@ -160,7 +172,8 @@ def create_collection(name: str,
 
 # Define material functions
 def load_texture(texture: roommesh.Texture,
-                 folder_path: str | Path) -> bpy.types.Image | None:
+                 folder_path: str | Path,
+                 image_cache: dict[tuple[str, ...], bpy.types.Image] | None = None) -> bpy.types.Image | None:
     """
     Loads a texture image. If the image already exists, no new image is created and the existing one is
     returned.
@@ -168,6 +181,8 @@ def load_texture(texture: roommesh.Texture,
     Args:
         texture (Texture): The texture to load.
         folder_path (str | Path): The path to where the imported RoomMesh is located.
+        image_cache (dict[tuple[str, ...], Image] | None): Images already loaded during this import, keyed by folder,
+        filename and colorspace.
 
     Returns:
         Image | None: The image loaded, if found.
@@ -181,8 +196,17 @@ def load_texture(texture: roommesh.Texture,
         # Return None
         return None
 
-    # Get path
-    texture_path: Path = (Path(folder_path) / Path(texture.filename)).resolve()
+    # Get expected colorspace, diffuse maps are color data and other maps are not
+    colorspace: str = "sRGB" if texture.layer_ID == 1 else "Non-Color"
+
+    # Check if image was already loaded with this colorspace
+    cache_key: tuple[str, ...] = (str(folder_path), texture.filename, colorspace)
+    if image_cache is not None and cache_key in image_cache:
+        # Return cached image
+        return image_cache[cache_key]
+
+    # Get absolute path without resolving symlinks
+    texture_path: Path = Path(os.path.abspath(os.path.join(folder_path, texture.filename)))
 
     # Ensure path exists
     if not texture_path.is_file():
@@ -203,6 +227,18 @@ def load_texture(texture: roommesh.Texture,
         # Return None
         return None
 
+    # Use a separate image if this file is already used with another colorspace
+    if (image_cache is not None and image.colorspace_settings.name != colorspace
+            and any(cached is image for cached in image_cache.values())):
+        image = image.copy()
+
+    # Set colorspace once per image and colorspace
+    image.colorspace_settings.name = colorspace
+
+    # Cache image for other objects using it
+    if image_cache is not None:
+        image_cache[cache_key] = image
+
     # Return new image
     return image
 
@@ -242,7 +278,8 @@ def create_material(name: str) -> bpy.types.Material | None:
     return material
 
 def give_material(obj: bpy.types.Object,
-                  new_material: bpy.types.Material) -> None:
+                  new_material: bpy.types.Material,
+                  check_existing: bool = True) -> None:
     """
     Gives a material to an object. If the object is unable to have materials, an error is reported. If the object
     already has the material, that material is made active.
@@ -250,6 +287,8 @@ def give_material(obj: bpy.types.Object,
     Args:
         obj (bpy Object): The object appending a material to.
         new_material (Material): The material to append.
+        check_existing (bool): Searches the object's slots for the material first. Can be disabled for freshly built
+        meshes, which have no slots.
 
     Returns:
         None.
@@ -264,7 +303,7 @@ def give_material(obj: bpy.types.Object,
         return
 
     # Ensure object does not already contain the materials
-    for index, existing_material in enumerate(obj.data.materials):
+    for index, existing_material in enumerate(obj.data.materials if check_existing else ()):
         # Check if material exists
         if new_material is existing_material:
             # Set active material
@@ -281,7 +320,10 @@ def give_material(obj: bpy.types.Object,
 
 def generate_material(obj: roommesh.Object,
                       name: str,
-                      folder_path: str | Path) -> bpy.types.Material | None:
+                      folder_path: str | Path,
+                      image_cache: dict[tuple[str, ...], bpy.types.Image] | None = None,
+                      material_cache: dict[tuple[str, str, str], bpy.types.Material] | None = None
+                      ) -> bpy.types.Material | None:
     """
     Creates a material for the RoomMesh object based on its texture data, then returns the generated material.
 
@@ -289,18 +331,34 @@ def generate_material(obj: roommesh.Object,
         obj (roommesh Object): The object to generate the material from.
         name (str): The name of the material.
         folder_path (str | Path): The path to the folder containing the RoomMesh file.
+        image_cache (dict[tuple[str, ...], Image] | None): Images already loaded during this import.
+        material_cache (dict[tuple[str, str, str], Material] | None): Materials already generated during this import,
+        keyed by their diffuse, lightmap and alpha filenames.
 
     Returns:
         Material: The material generated.
     """
 
+    # Index textures by layer, keeping the first texture with a filename
+    textures_by_layer: dict[int, roommesh.Texture] = {}
+    for texture in obj.textures:
+        if texture.filename and texture.layer_ID not in textures_by_layer:
+            textures_by_layer[texture.layer_ID] = texture
+
     # Get filename
-    diffuse_texture: roommesh.Texture | None = next((texture for texture in obj.textures if
-                                                     texture.layer_ID == 1 and texture.filename), None)
-    lightmap_texture: roommesh.Texture | None = next((texture for texture in obj.textures if
-                                                     texture.layer_ID == 2 and texture.filename), None)
-    alpha_texture: roommesh.Texture | None = next((texture for texture in obj.textures if
-                                                     texture.layer_ID == 3 and texture.filename), None)
+    diffuse_texture: roommesh.Texture | None = textures_by_layer.get(1)
+    lightmap_texture: roommesh.Texture | None = textures_by_layer.get(2)
+    alpha_texture: roommesh.Texture | None = textures_by_layer.get(3)
+
+    # Check if a material with the same textures was already generated
+    material_key: tuple[str, str, str] = (
+        diffuse_texture.filename if diffuse_texture else '',
+        lightmap_texture.filename if lightmap_texture else '',
+        alpha_texture.filename if alpha_texture else ''
+    )
+    if material_cache is not None and material_key in material_cache:
+        # Return shared material
+        return material_cache[material_key]
 
     # Get or create material
     material: bpy.types.Material | None = create_material(name)
@@ -340,7 +398,7 @@ def generate_material(obj: roommesh.Object,
     # Get textures
     if diffuse_texture:
         # Attempt to load image
-        image: bpy.types.Image | None = load_texture(diffuse_texture, folder_path)
+        image: bpy.types.Image | None = load_texture(diffuse_texture, folder_path, image_cache)
 
         # Ensure image loaded
         if image:
@@ -348,11 +406,10 @@ def generate_material(obj: roommesh.Object,
             diffuse_node = nodes.new("ShaderNodeTexImage")
             diffuse_node.image = image
             diffuse_node.location = (-600, 100)
-            diffuse_node.image.colorspace_settings.name = "sRGB"
 
     if lightmap_texture:
         # Attempt to load image
-        image: bpy.types.Image | None = load_texture(lightmap_texture, folder_path)
+        image: bpy.types.Image | None = load_texture(lightmap_texture, folder_path, image_cache)
 
         # Ensure image loaded
         if image:
@@ -360,11 +417,10 @@ def generate_material(obj: roommesh.Object,
             lightmap_node = nodes.new("ShaderNodeTexImage")
             lightmap_node.image = image
             lightmap_node.location = (-600, 300)
-            lightmap_node.image.colorspace_settings.name = "Non-Color"
 
     if alpha_texture:
         # Attempt to load image
-        image: bpy.types.Image | None = load_texture(alpha_texture, folder_path)
+        image: bpy.types.Image | None = load_texture(alpha_texture, folder_path, image_cache)
 
         # Ensure image loaded
         if image:
@@ -372,7 +428,6 @@ def generate_material(obj: roommesh.Object,
             alpha_node = nodes.new("ShaderNodeTexImage")
             alpha_node.image = image
             alpha_node.location = (-600, 500)
-            alpha_node.image.colorspace_settings.name = "Non-Color"
 
     # Ensure diffuse node loaded
     if diffuse_node:
@@ -383,19 +438,24 @@ def generate_material(obj: roommesh.Object,
         # Set diffuse as base color
         links.new(alpha_node.outputs["Alpha"], principled.inputs["Alpha"])
 
+    # Share material with objects using the same textures
+    if material_cache is not None:
+        material_cache[material_key] = material
+
     # Return new material
     return material
 
 # Mesh functions
-def build_mesh(vertex_positions: list[tuple[float, float, float]],
-               triangle_indices: list[tuple[int, int, int]],
+def build_mesh(vertex_positions: np.ndarray,
+               triangle_indices: np.ndarray,
                name: str) -> bpy.types.Mesh:
     """
-    Builds a Blender Mesh using vertex positions and triangle data.
+    Builds a Blender Mesh using vertex positions and triangle data. Positions are converted to Blender scale as they
+    are copied in, so the mesh needs no further transform.
 
     Args:
-        vertex_positions (list[tuple[float, float, float]]): A list of vertex positions.
-        triangle_indices (list[tuple[int, int, int]]): A list of vertex indices making up triangles.
+        vertex_positions (ndarray): The vertex positions in RoomMesh units, either flat or shaped (vertex count, 3).
+        triangle_indices (ndarray): The vertex indices making up triangles, either flat or shaped (triangle count, 3).
         name (str): The name of the mesh.
 
     Returns:
@@ -405,18 +465,29 @@ def build_mesh(vertex_positions: list[tuple[float, float, float]],
     # Create new mesh
     mesh: bpy.types.Mesh = bpy.data.meshes.new(name)
 
+    # Convert mesh data to flat arrays
+    positions: np.ndarray = (np.asarray(vertex_positions).reshape(-1, 3) * ROOMMESH_SCALE).astype(np.float32)
+    indices: np.ndarray = np.asarray(triangle_indices, dtype=np.int32).reshape(-1, 3)
+
     # Reverse triangle order to fix inverted face normals
-    reversed_indices = [(tri[2], tri[1], tri[0]) for tri in triangle_indices]
+    loop_vertices: np.ndarray = np.ascontiguousarray(indices[:, ::-1]).ravel()
+
+    # Allocate mesh elements
+    mesh.vertices.add(len(positions))
+    mesh.loops.add(len(loop_vertices))
+    mesh.polygons.add(len(indices))
 
     # Build mesh from data
-    mesh.from_pydata(vertex_positions, [], reversed_indices)
+    mesh.vertices.foreach_set("co", positions.ravel())
+    mesh.loops.foreach_set("vertex_index", loop_vertices)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(loop_vertices), 3, dtype=np.int32))
+
+    # Apply mesh changes and generate edges
+    mesh.update(calc_edges=True)
 
     # Ensure mesh data is valid
     mesh.validate(clean_customdata=False)
 
-    # Apply mesh transforms
-    mesh.update()
-
     # Return mesh
     return mesh
 
@@ -434,8 +505,10 @@ def build_object(room_obj: roommesh.Object,
     """
 
     # Get object data
-    vertex_positions: list[tuple[float, float, float]] = [vertex.pos.pos for vertex in room_obj.vertices]
-    triangle_indices: list[tuple[int, int, int]] = [triangle.indices for triangle in room_obj.triangles]
+    vertex_positions: np.ndarray = np.frombuffer(room_obj.positions, dtype=np.float32)
+    triangle_indices: np.ndarray = np.frombuffer(room_obj.indices, dtype=np.uint32)
+    uvs_1: np.ndarray = np.frombuffer(room_obj.uvs_1, dtype=np.float32).reshape(-1, 2)
+    colors: np.ndarray = np.frombuffer(room_obj.colors, dtype=np.uint8).reshape(-1, 3)
 
     # Create mesh
     mesh = build_mesh(vertex_positions, triangle_indices, name)
@@ -443,18 +516,16 @@ def build_object(room_obj: roommesh.Object,
     # Create UV maps
     diffuse_uv: bpy.types.MeshUVLoopLayer = mesh.uv_layers.new(name="DiffuseUVMap")
 
-    # Loop through faces
-    for poly in mesh.polygons:
-        # Loop through vertex loops
-        for loop_index in range(poly.loop_start, poly.loop_start + poly.loop_total):
-            # Get vertex index
-            vertex_index: int = mesh.loops[loop_index].vertex_index
+    # Get vertex index of every loop
+    loop_vertices: np.ndarray = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
 
-            # Get UV data
-            u, v = room_obj.vertices[vertex_index].uv_1.pos
+    # Gather UV data per loop and flip V
+    loop_uvs: np.ndarray = uvs_1[loop_vertices]
+    loop_uvs[:, 1] = 1.0 - loop_uvs[:, 1]
 
-            # Write UV data
-            diffuse_uv.data[loop_index].uv = (u, 1-v)
+    # Write UV data
+    diffuse_uv.data.foreach_set("uv", loop_uvs.ravel())
 
     # Set active UV layer
     mesh.uv_layers.active = diffuse_uv
@@ -466,10 +537,12 @@ def build_object(room_obj: roommesh.Object,
         domain="POINT"
     )
 
-    # Loop through vertices
-    for vertex_index, vertex in enumerate(room_obj.vertices):
-        # Set vertex color
-        vertex_colors.data[vertex_index].color = normalize_color(room_obj.vertices[vertex_index].color)
+    # Normalize vertex colors and add alpha
+    rgba: np.ndarray = np.ones((len(colors), 4), dtype=np.float32)
+    rgba[:, :3] = colors / 255.0
+
+    # Write vertex colors
+    vertex_colors.data.foreach_set("color", rgba.ravel())
 
     # Create new Blender Object
     blend_obj: bpy.types.Object = bpy.data.objects.new(name, mesh)
@@ -477,9 +550,6 @@ def build_object(room_obj: roommesh.Object,
     # Set object location
     blend_obj.location = (0.0, 0.0, 0.0)
 
-    # Apply transforms
-    transform_mesh(blend_obj)
-
     # Return object
     return blend_obj
 
@@ -502,8 +572,8 @@ def build_collision(collision: roommesh.Collision,
     """
 
     # Get collision data
-    vertex_positions: list[tuple[float, float, float]] = [vertex.pos for vertex in collision.vertices]
-    triangle_indices: list[tuple[int, int, int]] = [triangle.indices for triangle in collision.triangles]
+    vertex_positions: np.ndarray = np.frombuffer(collision.positions, dtype=np.float32)
+    triangle_indices: np.ndarray = np.frombuffer(collision.indices, dtype=np.uint32)
 
     # Create new mesh
     mesh = build_mesh(vertex_positions, triangle_indices, name)
@@ -523,23 +593,23 @@ def build_collision(collision: roommesh.Collision,
         # Set trigger name
         new_obj.roommesh.trigger_name = trigger_name
 
-    # Apply transforms
-    transform_mesh(new_obj)
-
     # Return object
     return new_obj
 
 # Define point functions
 def build_screen(screen: roommesh.Screen,
                 name: str,
-                filepath: Path) -> bpy.types.Object:
+                screens_dir: Path,
+                image_cache: dict[tuple[str, ...], bpy.types.Image] | None = None) -> bpy.types.Object:
     """
     Creates an empty image for a screen and returns the new Blender Object.
 
     Args:
         screen (Screen): The screen data.
         name (str): The name of the new screen.
-        filepath (Path): Path of the RoomMesh folder. Used for getting image data.
+        screens_dir (Path): Path of the folder containing screen images.
+        image_cache (dict[tuple[str, ...], Image] | None): Images already loaded during this import, keyed by folder
+        and filename.
 
     Returns:
         Object: The new Blender Object.
@@ -560,13 +630,26 @@ def build_screen(screen: roommesh.Screen,
     # Apply transforms
     transform_mesh(screen_empty, True)
 
+    # Check if screen image was already loaded
+    cache_key: tuple[str, ...] = (str(screens_dir), screen.path)
+    if image_cache is not None and cache_key in image_cache:
+        # Use cached image
+        screen_empty.data = image_cache[cache_key]
+
+        # Return screen
+        return screen_empty
+
     # Attempt to get screen image
     try:
         # Load screen image
-        screen_empty.data = bpy.data.images.load(str(filepath.parent / Path(f"screens/{screen.path}")), check_existing=True)
+        screen_empty.data = bpy.data.images.load(str(screens_dir / screen.path), check_existing=True)
     except RuntimeError:
         # Report error message
         report("Unable to load screen image.", "Screen failure", "ERROR")
+    else:
+        # Cache image for other screens using it
+        if image_cache is not None:
+            image_cache[cache_key] = screen_empty.data
 
     # Return screen
     return screen_empty
@@ -664,7 +747,7 @@ def build_spotlight(spotlight: roommesh.Spotlight,
     ratio = inner_deg / outer_deg if outer_deg > 0.0 else 1.0
 
     # Set spotlight properties
-    point_spotlight.spot_size = math.radians(outer_deg)
+    point_spotlight.spot_size = outer_deg * DEG_TO_RAD
     point_spotlight.spot_blend = max(0.0, min(1.0, 1.0 - ratio))
 
     # Create new object
@@ -675,9 +758,9 @@ def build_spotlight(spotlight: roommesh.Spotlight,
 
     # Set rotation
     spotlight_obj.rotation_euler = (
-        math.radians(spotlight.angle.pitch),
-        math.radians(spotlight.angle.roll),
-        math.radians(spotlight.angle.yaw)
+        spotlight.angle.pitch * DEG_TO_RAD,
+        spotlight.angle.roll * DEG_TO_RAD,
+        spotlight.angle.yaw * DEG_TO_RAD
     )
 
     # Apply transforms
@@ -744,9 +827,9 @@ def build_playerstart(player_start: roommesh.PlayerStart,
 
     # Set rotation
     start_empty.rotation_euler = (
-        math.radians(player_start.angle.pitch),
-        math.radians(player_start.angle.roll),
-        math.radians(player_start.angle.yaw)
+        player_start.angle.pitch * DEG_TO_RAD,
+        player_start.angle.roll * DEG_TO_RAD,
+        player_start.angle.yaw * DEG_TO_RAD
     )
 
     # Set UI
@@ -758,13 +841,13 @@ def build_playerstart(player_start: roommesh.PlayerStart,
     # Return start
     return start_empty
 
-def build_model(folder: Path | str,
+def build_model(props_dir: Path,
                 filename: Path | str) -> bpy.types.Object | None:
     """
     Attempts to import a .x model using the BVE Import/Export plugin.
 
     Args:
-        folder (Path | str): Path to the folder containing the RoomMesh.
+        props_dir (Path): Path to the folder containing the RoomMesh props.
         filename (Path | str): Full name of the .x file.
 
     Returns:
@@ -772,7 +855,10 @@ def build_model(folder: Path | str,
     """
 
     # Create prop path
-    filepath: Path = Path(folder) / Path("props") / Path(filename)
+    filepath: Path = props_dir / filename
+
+    # Import DirectX importer only when a room has models
+    from .bve import direct_x
 
     # Create importer
     importer = direct_x.ImportDirectXXFile()
@@ -795,12 +881,133 @@ def build_model(folder: Path | str,
     # Return model
     return model
 
-def import_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
+@lru_cache(maxsize=256)
+def get_rotation(pitch: float,
+                 roll: float,
+                 yaw: float) -> mathutils.Matrix:
+    """
+    Converts RoomMesh point angles into a rotation matrix. Results are cached, as many points share angles.
+
+    Args:
+        pitch (float): The pitch in degrees.
+        roll (float): The roll in degrees.
+        yaw (float): The yaw in degrees.
+
+    Returns:
+        Matrix: The frozen 3x3 rotation matrix.
+    """
+
+    # Return rotation matrix
+    return mathutils.Euler((pitch * DEG_TO_RAD, roll * DEG_TO_RAD, yaw * DEG_TO_RAD)).to_matrix().freeze()
+
+def place_model(model: roommesh.Model,
+                name: str,
+                props_dir: Path,
+                model_cache: dict[str, tuple[bpy.types.Object, tuple[float, float, float]]] | None = None
+                ) -> bpy.types.Object | None:
+    """
+    Imports the .x model of a RoomMesh Model point and places it at the point's transform. Models already imported
+    are duplicated, sharing their mesh data.
+
+    Args:
+        model (Model): The RoomMesh Model point.
+        name (str): The point name. Unused, as the model keeps the name given by its importer.
+        props_dir (Path): Path to the folder containing the RoomMesh props.
+        model_cache (dict[str, tuple[Object, tuple[float, float, float]]] | None): Models already imported during
+        this import and their imported scale, keyed by model path.
+
+    Returns:
+        Object | None: The placed model, if imported successfully, otherwise None.
+    """
+
+    # Check if model was already imported
+    if model_cache is not None and model.path in model_cache:
+        # Duplicate model, sharing its already scaled mesh
+        imported_obj, imported_scale = model_cache[model.path]
+        model_obj: bpy.types.Object = imported_obj.copy()
+    else:
+        # Import model object
+        model_obj: bpy.types.Object | None = build_model(props_dir, model.path)
+
+        # Ensure model loaded
+        if model_obj is None:
+            # Return None
+            return None
+
+        # Apply transforms to the new mesh
+        transform_mesh(model_obj)
+
+        # Save imported scale before the point scale is applied
+        imported_scale: tuple[float, float, float] = tuple(model_obj.scale)
+
+        # Cache model for other points using it
+        if model_cache is not None:
+            model_cache[model.path] = (model_obj, imported_scale)
+
+    # Get model location
+    x, y, z = model.pos.pos
+    location: tuple[float, float, float] = (x * ROOMMESH_SCALE, y * ROOMMESH_SCALE, z * ROOMMESH_SCALE)
+
+    # Get model rotation
+    rotation: mathutils.Matrix = get_rotation(model.angle.pitch, model.angle.roll, model.angle.yaw)
+
+    # Combine imported scale with point scale
+    sx, sy, sz = imported_scale
+    px, py, pz = model.scale.scale
+
+    # Set location, rotation and scale in a single matrix
+    model_obj.matrix_basis = mathutils.Matrix.LocRotScale(location, rotation, (sx * px, sy * py, sz * pz))
+
+    # Return model
+    return model_obj
+
+def parse_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
+    """
+    Reads and parses a RoomMesh file without touching any Blender data, so it is safe to run on a worker thread.
+
+    Args:
+        filepath (Path): The path to the RoomMesh being parsed.
+
+    Returns:
+        RoomMesh | None: The parsed RoomMesh, or None if the file doesn't exist.
+    """
+
+    # Create path
+    filepath: Path = Path(filepath)
+
+    # Ensure path exists
+    if not filepath.is_file():
+        # Return None, the error is reported when the room is imported
+        return None
+
+    # Create RoomMesh
+    room: roommesh.RoomMesh = roommesh.RoomMesh()
+
+    # Open file
+    with filepath.open("rb") as rmesh:
+        # Parse empty files directly, as they can't be mapped and the parser reports the missing data
+        if filepath.stat().st_size == 0:
+            room.parse(rmesh)
+
+            # Return RoomMesh data
+            return room
+
+        # Map the file into memory so its pages are read directly instead of copied into a buffer
+        with mmap.mmap(rmesh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Generate data
+            room.parse(data)
+
+    # Return RoomMesh data
+    return room
+
+def import_roommesh(filepath: Path,
+                    room: roommesh.RoomMesh | None = None) -> roommesh.RoomMesh | None:
     """
     Imports all objects and data within a RoomMesh file.
     
     Args:
         filepath (Path): The path to the RoomMesh being imported.
+        room (RoomMesh | None): Data already parsed from the file. If none is provided, the file is parsed.
     
     Returns:
         RoomMesh: The RoomMesh object created.
@@ -817,13 +1024,9 @@ def import_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
         # Return None
         return None
     
-    # Create RoomMesh
-    room: roommesh.RoomMesh = roommesh.RoomMesh()
-    
-    # Open RoomMesh file
-    with filepath.open("rb") as rmesh:
-        # Generate data
-        room.parse(rmesh)
+    # Parse RoomMesh if needed
+    if room is None:
+        room = parse_roommesh(filepath)
     
     # Create collections
     room_collection: bpy.types.Collection = create_collection(filepath.stem)
@@ -839,6 +1042,15 @@ def import_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
     playerstart_collection: bpy.types.Collection = create_collection("Player Starts", parent=point_collection)
     model_collection: bpy.types.Collection = create_collection("Models", parent=point_collection)
 
+    # Create pending collection links, linked together once everything is built
+    pending_links: dict[bpy.types.Collection, list[bpy.types.Object]] = {}
+
+    # Create image cache for textures shared between objects
+    image_cache: dict[tuple[str, ...], bpy.types.Image] = {}
+
+    # Create material cache for objects with identical textures
+    material_cache: dict[tuple[str, str, str], bpy.types.Material] = {}
+
     # Save object count
     object_index: int = 0
 
@@ -846,16 +1058,16 @@ def import_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
     for obj in room.objects:
         # Generate materials
         obj_material: bpy.types.Material = (generate_material(
-            obj, f"obj_{object_index}_material", filepath.parent))
+            obj, f"obj_{object_index}_material", filepath.parent, image_cache, material_cache))
 
         # Generate mesh
         obj_mesh: bpy.types.Object = build_object(obj, f"obj_{object_index}")
 
         # Apply materials
-        give_material(obj_mesh, obj_material)
+        give_material(obj_mesh, obj_material, check_existing=False)
 
-        # Add object to collection
-        object_collection.objects.link(obj_mesh)
+        # Queue object for its collection
+        pending_links.setdefault(object_collection, []).append(obj_mesh)
 
         # Increment object count
         object_index += 1
@@ -869,8 +1081,8 @@ def import_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
         collision_mesh: bpy.types.Object = build_collision(
             collision, f"collision_{collision_index}", False)
 
-        # Add collision to collection
-        collision_collection.objects.link(collision_mesh)
+        # Queue collision for its collection
+        pending_links.setdefault(collision_collection, []).append(collision_mesh)
 
         # Increment collision count
         collision_index += 1
@@ -890,115 +1102,67 @@ def import_roommesh(filepath: Path) -> roommesh.RoomMesh | None:
             collision_mesh: bpy.types.Object = build_collision(
                 collision, f"collision_{mesh_index}", True, f"{trigger.name}_{mesh_index}")
 
-            # Add collision to trigger collection
-            trigger_collision_collection.objects.link(collision_mesh)
+            # Queue collision for its trigger collection
+            pending_links.setdefault(trigger_collision_collection, []).append(collision_mesh)
 
             # Increment mesh count
             mesh_index += 1
 
+    # Get point asset folders
+    screens_dir: Path = filepath.parent.parent / "screens"
+    props_dir: Path = filepath.parent / "props"
+
+    # Create model cache for points sharing a model
+    model_cache: dict[str, tuple[bpy.types.Object, tuple[float, float, float]]] = {}
+
+    # Map point types to their builders, collections and name prefixes
+    point_builders: dict[type, tuple[Callable[[roommesh.Point, str], bpy.types.Object | None],
+                                     bpy.types.Collection, str]] = {
+        roommesh.Screen: (partial(build_screen, screens_dir=screens_dir, image_cache=image_cache),
+                          screen_collection, "screen"),
+        roommesh.Waypoint: (build_waypoint, waypoint_collection, "waypoint"),
+        roommesh.Light: (build_light, light_collection, "light"),
+        roommesh.Spotlight: (build_spotlight, spotlight_collection, "spotlight"),
+        roommesh.SoundEmitter: (build_soundemitter, soundemitter_collection, "soundemitter"),
+        roommesh.PlayerStart: (build_playerstart, playerstart_collection, "playerstart"),
+        roommesh.Model: (partial(place_model, props_dir=props_dir, model_cache=model_cache), model_collection, "model")
+    }
+
     # Save point counts
-    screen_index: int = 0
-    waypoint_index: int = 0
-    light_index: int = 0
-    spotlight_index: int = 0
-    soundemitter_index: int = 0
-    playerstart_index: int = 0
-    model_index: int = 0
+    point_counts: dict[type, int] = dict.fromkeys(point_builders, 0)
 
     # Loop through points
     for point in room.points:
-        # Create screen
-        if isinstance(point, roommesh.Screen):
-            # Create new screen
-            screen = build_screen(point, f"screen_{screen_index}", filepath.parent)
-
-            # Add screen to collection
-            screen_collection.objects.link(screen)
-
-            # Increment screen count
-            screen_index += 1
-
-        # Create waypoint
-        if isinstance(point, roommesh.Waypoint):
-            # Create new waypoint
-            waypoint = build_waypoint(point, f"waypoint_{waypoint_index}")
-
-            # Add waypoint to collection
-            waypoint_collection.objects.link(waypoint)
-
-            # Increment waypoint count
-            waypoint_index += 1
-
-        # Create light
-        if isinstance(point, roommesh.Light):
-            # Create new point light
-            light = build_light(point, f"light_{light_index}")
-
-            # Add light to collection
-            light_collection.objects.link(light)
-
-            # Increment light count
-            light_index += 1
-
-        # Create spotlight
-        if isinstance(point, roommesh.Spotlight):
-            # Create new spotlight
-            spotlight = build_spotlight(point, f"spotlight_{spotlight_index}")
-
-            # Add spotlight to collection
-            spotlight_collection.objects.link(spotlight)
-
-            # Increment spotlight index
-            spotlight_index += 1
-
-        # Create sound emitter
-        if isinstance(point, roommesh.SoundEmitter):
-            # Create new sound emitter
-            sound_emitter = build_soundemitter(point, f"soundemitter_{soundemitter_index}")
-
-            # Add sound emitter to collection
-            soundemitter_collection.objects.link(sound_emitter)
-
-            # Increment sound emitter count
-            soundemitter_index += 1
-
-        # Create player start
-        if isinstance(point, roommesh.PlayerStart):
-            # Create new player start
-            start = build_playerstart(point, f"playerstart_{playerstart_index}")
-
-            # Add player start to collection
-            playerstart_collection.objects.link(start)
-
-            # Increment sound emitter count
-            playerstart_index += 1
+        # Get point builder
+        point_type: type = type(point)
+        entry = point_builders.get(point_type)
 
-        # Import models
-        if isinstance(point, roommesh.Model):
-            # Import model object
-            model = build_model(filepath.parent, point.path)
+        # Skip unsupported points
+        if entry is None:
+            continue
 
-            # Set model location
-            model.location = point.pos.pos
+        # Build point
+        builder, collection, prefix = entry
+        point_obj: bpy.types.Object | None = builder(point, f"{prefix}_{point_counts[point_type]}")
 
-            # Set model rotation
-            model.rotation_euler = (
-                math.radians(point.angle.pitch),
-                math.radians(point.angle.roll),
-                math.radians(point.angle.yaw)
-            )
+        # Ensure point was built
+        if point_obj is None:
+            continue
 
-            # Apply point scale
-            model.matrix_basis @= mathutils.Matrix.Diagonal(mathutils.Vector((*point.scale.scale, 1.0)))
+        # Queue point for its collection
+        pending_links.setdefault(collection, []).append(point_obj)
 
-            # Apply transforms
-            transform_mesh(model)
+        # Increment point count
+        point_counts[point_type] += 1
 
-            # Add model to collection
-            model_collection.objects.link(model)
+    # Link all built objects to their collections
+    for collection, objects in pending_links.items():
+        # Get link function
+        link = collection.objects.link
 
-            # Increment model count
-            model_index += 1
+        # Link objects
+        for obj in objects:
+            link(obj)
 
     # Return RoomMesh data
     return room
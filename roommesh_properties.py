@@ -1,6 +1,64 @@
 # Import modules
 import bpy
 
+# Guard against update callbacks triggering each other
+_updating: bool = False
+
+def set_flags(props: bpy.types.PropertyGroup,
+              **flags: bool) -> None:
+    """
+    Sets object flags and their custom property copies without running their update callbacks again.
+
+    Args:
+        props (PropertyGroup): The property group holding the flags.
+        **flags (bool): The flag names and their new values.
+
+    Returns:
+        None.
+    """
+
+    # Enable update guard
+    global _updating
+    _updating = True
+
+    # Attempt to set flags
+    try:
+        # Loop through flags
+        for name, value in flags.items():
+            # Update property if it changed
+            if getattr(props, name) != value:
+                setattr(props, name, value)
+
+        # Update custom properties in one write
+        props.id_data.id_properties_ensure().update(flags)
+    finally:
+        # Disable update guard
+        _updating = False
+
+def set_collision_display(obj: bpy.types.Object,
+                          is_collision: bool) -> None:
+    """
+    Updates how an object is displayed when it is marked or unmarked as collision.
+
+    Args:
+        obj (Object): The object to update.
+        is_collision (bool): Whether the object is collision.
+
+    Returns:
+        None.
+    """
+
+    # Get display properties
+    display_type: str = "WIRE" if is_collision else "SOLID"
+
+    # Update object properties that changed
+    if obj.display_type != display_type:
+        obj.display_type = display_type
+    if obj.show_in_front != is_collision:
+        obj.show_in_front = is_collision
+    if obj.hide_render != is_collision:
+        obj.hide_render = is_collision
+
 # Object Properties
 def update_is_collision(self: bpy.types.PropertyGroup,
                         context: bpy.types.Context) -> None:
@@ -18,34 +76,34 @@ def update_is_collision(self: bpy.types.PropertyGroup,
     # Get object
     obj: bpy.types.Object | None = self.id_data
 
-    # Ensure object was loaded
-    if not obj:
+    # Ensure object was loaded and this isn't a nested update
+    if not obj or _updating:
+        return
+
+    # Skip toggles that didn't change the stored value
+    if bool(self.is_collision) == obj.get("is_collision", False):
         return
 
-    # Update is_collision property
-    self.id_data["is_collision"] = bool(self.is_collision)
+    # Get flags to update
+    flags: dict[str, bool] = {"is_collision": bool(self.is_collision)}
 
     # Check if collision is enabled
     if self.is_collision:
-        # Update object properties
-        self.id_data.display_type = "WIRE"
-        self.id_data.show_in_front = True
-        self.id_data.hide_render = True
-
         # Check if model is on
         if self.is_model:
             # Turn off model
-            self.is_model = False
+            flags["is_model"] = False
     else:
-        # Update object properties
-        self.id_data.display_type = "SOLID"
-        self.id_data.show_in_front = False
-        self.id_data.hide_render = False
-
         # Check if trigger is on
         if self.is_trigger:
             # Turn off trigger
-            self.is_trigger = False
+            flags["is_trigger"] = False
+
+    # Update object properties
+    set_collision_display(obj, self.is_collision)
+
+    # Update flags
+    set_flags(self, **flags)
 
 def update_is_trigger(self: bpy.types.PropertyGroup,
                         context: bpy.types.Context) -> None:
@@ -63,19 +121,16 @@ def update_is_trigger(self: bpy.types.PropertyGroup,
     # Get object
     obj: bpy.types.Object | None = self.id_data
 
-    # Ensure object was loaded
-    if not obj:
+    # Ensure object was loaded and this isn't a nested update
+    if not obj or _updating:
         return
 
-    # Update is_trigger property
-    self.id_data["is_trigger"] = bool(self.is_trigger)
+    # Skip toggles that didn't change the stored value
+    if bool(self.is_trigger) == obj.get("is_trigger", False):
+        return
 
-    # Check if trigger is on:
-    if self.is_trigger:
-        # Check if collision is off
-        if not self.is_collision:
-            # Turn trigger off
-            self.is_trigger = False
+    # Update is_trigger property, triggers require collision
+    set_flags(self, is_trigger=bool(self.is_trigger and self.is_collision))
 
 def update_is_model(self: bpy.types.PropertyGroup,
                         context: bpy.types.Context) -> None:
@@ -93,19 +148,46 @@ def update_is_model(self: bpy.types.PropertyGroup,
     # Get object
     obj: bpy.types.Object | None = self.id_data
 
-    # Ensure object was loaded
-    if not obj:
+    # Ensure object was loaded and this isn't a nested update
+    if not obj or _updating:
+        return
+
+    # Skip toggles that didn't change the stored value
+    if bool(self.is_model) == obj.get("is_model", False):
         return
 
-    # Update is_model property
-    self.id_data["is_model"] = bool(self.is_model)
+    # Get flags to update
+    flags: dict[str, bool] = {"is_model": bool(self.is_model)}
+
+    # Check if model is enabled and collision is on
+    if self.is_model and self.is_collision:
+        # Turn collision off
+        flags["is_collision"] = False
+        set_collision_display(obj, False)
+
+        # Turn trigger off
+        if self.is_trigger:
+            flags["is_trigger"] = False
+
+    # Update flags
+    set_flags(self, **flags)
+
+# Define point role items and their empty display types
+_POINT_ROLE_ITEMS: tuple[tuple[str, str, str, str], ...] = (
+    ('NONE', "None", "No type", "PLAIN_AXES"),
+    ('SCREEN', "Screen", "Save screen image", "IMAGE"),
+    ('WAYPOINT', "Waypoint", "NPC path point", "SINGLE_ARROW"),
+    ('PLAYERSTART', "Player Start", "Player spawn position", "SPHERE")
+)
 
-    # Check if model is enabled
-    if self.is_model:
-        # Check if collision is on
-        if self.is_collision:
-            # Turn collision/trigger off
-            self.is_collision = False
+# Define empty display type and point properties for each point role
+_POINT_ROLES: dict[str, tuple[str, dict[str, bool]]] = {
+    identifier: (display_type, {
+        "is_screen": identifier == "SCREEN",
+        "is_waypoint": identifier == "WAYPOINT",
+        "is_playerstart": identifier == "PLAYERSTART"
+    }) for identifier, _, _, display_type in _POINT_ROLE_ITEMS
+}
 
 def update_point(self: bpy.types.PropertyGroup,
                         context: bpy.types.Context) -> None:
@@ -127,20 +209,18 @@ def update_point(self: bpy.types.PropertyGroup,
     if not obj:
         return
 
-    # Update point properties
-    self.id_data["is_screen"] = bool(self.role == "SCREEN")
-    self.id_data["is_waypoint"] = bool(self.role == "WAYPOINT")
-    self.id_data["is_playerstart"] = bool(self.role == "PLAYERSTART")
+    # Get display type and point properties for role
+    display_type, point_flags = _POINT_ROLES[self.role]
+
+    # Skip role changes that didn't change the stored values
+    if obj.empty_display_type == display_type and all(obj.get(k) == v for k, v in point_flags.items()):
+        return
+
+    # Update point properties in one write
+    obj.id_properties_ensure().update(point_flags)
 
     # Set empty display type
-    if self.role == "SCREEN":
-        self.id_data.empty_display_type = "IMAGE"
-    elif self.role == "WAYPOINT":
-        self.id_data.empty_display_type = "SINGLE_ARROW"
-    elif self.role == "PLAYERSTART":
-        self.id_data.empty_display_type = "SPHERE"
-    elif self.role == "NONE":
-        self.id_data.empty_display_type = "PLAIN_AXES"
+    obj.empty_display_type = display_type
 
 def update_sound(self: bpy.types.PropertyGroup,
                         context: bpy.types.Context) -> None:
@@ -162,8 +242,12 @@ def update_sound(self: bpy.types.PropertyGroup,
     if not obj:
         return
 
+    # Skip sound changes that didn't change the stored value
+    if obj.get("sound_ID") == self.sound_ID:
+        return
+
     # Update sound properties
-    self.id_data["sound_ID"] = self.sound_ID
+    obj["sound_ID"] = self.sound_ID
 
 # RoomMesh properties class
 class RoomMeshObjectProperties(bpy.types.PropertyGroup):
@@ -212,12 +296,7 @@ class RoomMeshObjectProperties(bpy.types.PropertyGroup):
     # Set point type property
     role: bpy.props.EnumProperty(
         name="Point Type",
-        items=[
-            ('NONE', "None", "No type"),
-            ('SCREEN', "Screen", "Save screen image"),
-            ('WAYPOINT', "Waypoint", "NPC path point"),
-            ('PLAYERSTART', "Player Start", "Player spawn position")
-        ],
+        items=tuple(item[:3] for item in _POINT_ROLE_ITEMS),
         default='NONE',
         update=update_point
     )
@@ -276,19 +355,25 @@ class ROOMMESH_PT_object(bpy.types.Panel):
         layout.use_property_split = False
         layout.use_property_decorate = False
 
-        # Get custom properties
-        props = context.object.roommesh
+        # Get object and custom properties
+        obj: bpy.types.Object = context.object
+        obj_type: str = obj.type
+        props = obj.roommesh
 
         # Mesh properties
-        if context.object.type == 'MESH':
+        if obj_type == 'MESH':
+            # Get toggles
+            is_collision: bool = props.is_collision
+            is_model: bool = props.is_model
+
             # Add collision property
             collision_row = layout.row()
-            collision_row.enabled = not props.is_model
+            collision_row.enabled = not is_model
             collision_row.prop(props, "is_collision", text="Collision")
 
             # Add trigger property
             trigger_row = layout.row()
-            trigger_row.enabled = props.is_collision
+            trigger_row.enabled = is_collision
             trigger_row.prop(props, "is_trigger", text="Trigger")
 
             # Add trigger name property
@@ -298,30 +383,29 @@ class ROOMMESH_PT_object(bpy.types.Panel):
 
             # Add model property
             model_row = layout.row()
-            model_row.enabled = not props.is_collision
+            model_row.enabled = not is_collision
             model_row.prop(props, "is_model", text="Model")
 
             # Add model name property
             model_name_row = layout.row()
-            model_name_row.enabled = props.is_model
+            model_name_row.enabled = is_model
             model_name_row.prop(props, "model_name", text="Model Name")
 
         # Empty properties
-        if context.object.type == 'EMPTY':
+        elif obj_type == 'EMPTY':
             # Add point property
             point_row = layout.row()
-            point_row.prop_enum(props, 'role', "NONE")
-            point_row.prop_enum(props, 'role', "SCREEN")
-            point_row.prop_enum(props, 'role', "WAYPOINT")
-            point_row.prop_enum(props, 'role', "PLAYERSTART")
+            point_row.props_enum(props, 'role')
 
         # Speaker properties
-        if context.object.type == 'SPEAKER':
+        elif obj_type == 'SPEAKER':
             # Add sound ID property
             sound_row = layout.row()
             sound_row.prop(props, 'sound_ID', text="Sound ID")
 
 # Registration functions
+_pointers_registered: bool = False
+
 def register_pointers() -> None:
     """
     Attaches custom property groups to Blender data blocks.
@@ -330,11 +414,15 @@ def register_pointers() -> None:
         None.
     """
 
-    # Check if property doesn't exist
-    if not hasattr(bpy.types.Object, 'roommesh'):
+    # Check if this module hasn't registered the property yet
+    global _pointers_registered
+    if not _pointers_registered:
         # Add property
         bpy.types.Object.roommesh = bpy.props.PointerProperty(type=RoomMeshObjectProperties)
 
+        # Mark property as registered once the assignment succeeded
+        _pointers_registered = True
+
 def unregister_pointers() -> None:
     """
     Removes custom property groups from Blender data blocks.
@@ -343,10 +431,14 @@ def unregister_pointers() -> None:
         None.
     """
 
-    # Check if property exists
-    if hasattr(bpy.types.Object, 'roommesh'):
+    # Check if the property was registered, including by a module instance whose flag was reset by a reload
+    global _pointers_registered
+    if _pointers_registered or 'roommesh' in bpy.types.Object.bl_rna.properties:
         # Remove property
-        delattr(bpy.types.Object, 'roommesh')
+        del bpy.types.Object.roommesh
+
+        # Mark property as unregistered only after it was removed
+        _pointers_registered = False
 
 # Define classes for registration
 classes: tuple = (
@@ -364,8 +456,13 @@ def register() -> None:
 
     # Loop through classes
     for cls in classes:
-        # Register class
-        bpy.utils.register_class(cls)
+        # Attempt to register class
+        try:
+            bpy.utils.register_class(cls)
+        except ValueError:
+            # Replace class left registered by a previous reload
+            bpy.utils.unregister_class(cls)
+            bpy.utils.register_class(cls)
 
     # Register properties
     register_pointers()